@@ -0,0 +1,151 @@
+"""
+Font name normalization.
+
+Maps PDF internal font names to PowerPoint-compatible font names.
+"""
+
+import functools
+import re
+from typing import Optional
+
+
+# Subset prefix PDF producers put in front of embedded font names ('BCDEEE+')
+_SUBSET_RE = re.compile(r'^[A-Z]{6}\+')
+
+# Font mapping: PDF internal names -> PowerPoint-compatible names
+FONT_MAPPING = {
+    # Arial variants
+    "arialmt": "Arial",
+    "arial-boldmt": "Arial",
+    "arial-italicmt": "Arial",
+    "arial-bolditalicmt": "Arial",
+    "arialmtbold": "Arial",
+    "arialnarrow": "Arial Narrow",
+    "arialblack": "Arial Black",
+    # Times variants
+    "timesnewromanpsmt": "Times New Roman",
+    "timesnewromanps-boldmt": "Times New Roman",
+    "timesnewromanps-italicmt": "Times New Roman",
+    "timesnewroman": "Times New Roman",
+    "times": "Times New Roman",
+    # Helvetica -> Arial (common substitution)
+    "helvetica": "Arial",
+    "helveticaneue": "Arial",
+    "helveticaneue-light": "Arial",
+    "helveticaneue-bold": "Arial",
+    "helveticaneue-medium": "Arial",
+    # Calibri variants
+    "calibri": "Calibri",
+    "calibri-bold": "Calibri",
+    "calibri-italic": "Calibri",
+    "calibri-light": "Calibri Light",
+    # Cambria
+    "cambria": "Cambria",
+    "cambriamath": "Cambria Math",
+    # Georgia
+    "georgia": "Georgia",
+    "georgia-bold": "Georgia",
+    # Verdana
+    "verdana": "Verdana",
+    "verdana-bold": "Verdana",
+    # Tahoma
+    "tahoma": "Tahoma",
+    "tahoma-bold": "Tahoma",
+    # Trebuchet
+    "trebuchetms": "Trebuchet MS",
+    "trebuchetms-bold": "Trebuchet MS",
+    # Courier/Consolas (monospace)
+    "couriernew": "Courier New",
+    "couriernewpsmt": "Courier New",
+    "courier": "Courier New",
+    "consolas": "Consolas",
+    # Open Sans
+    "opensans": "Open Sans",
+    "opensans-regular": "Open Sans",
+    "opensans-bold": "Open Sans",
+    "opensans-light": "Open Sans",
+    # Roboto
+    "roboto": "Roboto",
+    "roboto-regular": "Roboto",
+    "roboto-bold": "Roboto",
+    "roboto-light": "Roboto",
+    # Segoe UI
+    "segoeui": "Segoe UI",
+    "segoeui-bold": "Segoe UI",
+    "segoeui-light": "Segoe UI Light",
+    # Source Sans
+    "sourcesanspro": "Source Sans Pro",
+    "sourcesanspro-regular": "Source Sans Pro",
+    # Lato
+    "lato": "Lato",
+    "lato-regular": "Lato",
+    "lato-bold": "Lato",
+}
+
+# Default fallback font
+DEFAULT_FONT = "Calibri"
+
+
+# Common font family substrings, checked when no FONT_MAPPING key matches
+_COMMON_FAMILIES = (
+    ("arial", "Arial"),
+    ("helvetica", "Arial"),
+    ("times", "Times New Roman"),
+    ("calibri", "Calibri"),
+    ("cambria", "Cambria"),
+    ("georgia", "Georgia"),
+    ("verdana", "Verdana"),
+    ("tahoma", "Tahoma"),
+    ("trebuchet", "Trebuchet MS"),
+    ("courier", "Courier New"),
+    ("consolas", "Consolas"),
+    ("segoe", "Segoe UI"),
+    ("roboto", "Roboto"),
+    ("opensans", "Open Sans"),
+    ("lato", "Lato"),
+)
+_COMMON_FAMILY_MAP = dict(_COMMON_FAMILIES)
+
+# Substring matchers: one alternation per table, longest keys first so that
+# e.g. 'arialnarrow' wins over 'arial' at the same position
+_FONT_KEY_RE = re.compile(
+    '|'.join(re.escape(key) for key in sorted(FONT_MAPPING, key=len, reverse=True))
+)
+_COMMON_FAMILY_RE = re.compile(
+    '|'.join(re.escape(key) for key in sorted(_COMMON_FAMILY_MAP, key=len, reverse=True))
+)
+
+
+@functools.lru_cache(maxsize=512)
+def normalize_font_name(pdf_font_name: Optional[str]) -> str:
+    """
+    Normalize a PDF font name to a PowerPoint-compatible font name.
+
+    PDF fonts often have internal names like 'ArialMT', 'TimesNewRomanPS-BoldMT',
+    'BCDEEE+Calibri', etc. This function maps them to standard names.
+    """
+    if not pdf_font_name:
+        return DEFAULT_FONT
+
+    # Remove common PDF font prefixes (subset prefixes like 'BCDEEE+')
+    clean_name = _SUBSET_RE.sub('', pdf_font_name)
+
+    # Normalize: lowercase, remove spaces and hyphens for matching
+    normalized = clean_name.lower().replace(' ', '').replace('-', '').replace('_', '')
+
+    # Check direct mapping
+    if normalized in FONT_MAPPING:
+        return FONT_MAPPING[normalized]
+
+    # Check if any mapping key is contained in the normalized name
+    match = _FONT_KEY_RE.search(normalized)
+    if match:
+        return FONT_MAPPING[match.group(0)]
+
+    match = _COMMON_FAMILY_RE.search(normalized)
+    if match:
+        return _COMMON_FAMILY_MAP[match.group(0)]
+
+    # If no match found, return the original (cleaned) name
+    # PowerPoint will use a fallback if it doesn't recognize the font
+    return clean_name if clean_name else DEFAULT_FONT
@@ -7,6 +7,8 @@ Defines the canonical SlideGraph JSON schema using Pydantic for validation.
 from typing import List, Optional, Literal, Dict, Any, Union
 from pydantic import BaseModel, Field, field_validator
 
+from sliderefactor.fonts import normalize_font_name
+
 
 class BBox(BaseModel):
     """Bounding box in [x0, y0, x1, y1] format (top-left to bottom-right)."""
@@ -27,6 +29,7 @@ class BBox(BaseModel):
         return iter(self.coords)
 
     def to_list(self) -> List[float]:
+        """Return the underlying coords list (not a copy); do not mutate it."""
         return self.coords
 
     @property
@@ -150,19 +153,29 @@ class TextRun(BaseModel):
     italic: bool = False
     underline: bool = False
     font_size: Optional[int] = None
-    font_name: Optional[str] = None
+    font_name: Optional[str] = None  # Normalized to a PowerPoint font name on construction
     color: Optional[str] = None  # Hex color
 
+    @field_validator("font_name")
+    @classmethod
+    def normalize_font(cls, v: Optional[str]) -> Optional[str]:
+        return normalize_font_name(v) if v else v
+
 
 class FontHints(BaseModel):
     """Font hints for a text box."""
 
-    name: Optional[str] = None
+    name: Optional[str] = None  # Normalized to a PowerPoint font name on construction
     size: Optional[int] = None
     bold: Optional[bool] = None
     italic: Optional[bool] = None
     color: Optional[str] = None  # Hex color (e.g. "#FF0000")
 
+    @field_validator("name")
+    @classmethod
+    def normalize_name(cls, v: Optional[str]) -> Optional[str]:
+        return normalize_font_name(v) if v else v
+
 
 class BulletItem(BaseModel):
     """A bullet point with optional nesting."""
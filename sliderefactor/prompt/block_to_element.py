@@ -6,12 +6,12 @@ Uses Google Gemini to intelligently convert OCR blocks into structured PPTX elem
 
 import os
 import json
-from typing import List, Optional, Dict, Any
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
-from google import genai
-from google.genai import types
-
 from sliderefactor.models import (
     Slide,
     Block,
@@ -29,6 +29,21 @@ from sliderefactor.models import (
 )
 
 
+# Per-thread message buffer. Batch post-processing runs on pool threads while
+# the main thread keeps printing, so its messages are collected and printed by
+# the main thread instead of interleaving with other output.
+_thread_log = threading.local()
+
+
+def _log(message: str) -> None:
+    """Print a message, or buffer it when called from batch post-processing."""
+    lines = getattr(_thread_log, "lines", None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
 class BlockToElementConverter:
     """
     Converts SlideGraph blocks into PPTX-ready elements using LLM prompting.
@@ -48,18 +63,10 @@ Priorities:
 2) Maximize editability: text must become textboxes, not images.
 3) Preserve layout: grouping, columns, bullets, titles.
 4) MANDATORY: Include ALL blocks of type 'image' or 'Picture' as image elements. Do not skip icons or logos.
-5) Use font metadata hints when available.
-
-Return valid JSON only. No extra text, no markdown code blocks, no explanations."""
-
-    USER_PROMPT_TEMPLATE = """Slide dimensions:
-- width_px: {width}
-- height_px: {height}
+5) Use font metadata hints when available."""
 
-Detected blocks:
-{blocks_json}
-
-Tasks:
+    # Task, schema and rule sections shared by the single- and multi-slide prompts
+    PLAN_INSTRUCTIONS = """Tasks:
 A) Determine reading order. Support 2-column layouts.
 B) Merge blocks into textboxes when they align and belong together (e.g., title spans, body paragraphs, bullet lists).
 C) Infer bullets:
@@ -67,61 +74,146 @@ C) Infer bullets:
    - Preserve nesting levels (0=top level, 1=first indent, etc.).
 D) Classify each textbox role: "title" (slide title), "subtitle" (under title), "body" (main content), "caption" (small text near images), or "footer" (bottom of slide).
 
-Output structure:
-{{
-  "elements": [
-    {{
-      "kind": "textbox",
-      "bbox": [x0, y0, x1, y1],
-      "role": "title|subtitle|body|caption|footer",
-      "structure": {{
-        "type": "bullets|paragraphs",
-        "items": [
-          // For bullets: {{"text": "...", "level": 0, "runs": [{{"text": "...", "bold": false}}]}}
-          // For paragraphs: "plain text string"
-        ]
-      }},
-      "style_hints": {{
-        "align": "left|center|right",
-        "weight": "regular|bold",
-        "size": "xs|sm|md|lg|xl",
-        "vertical_align": "top|middle|bottom"
-      }},
-      "font_hints": {{
-        "name": "Font name if available",
-        "size": 18
-      }},
-      "provenance": {{
-        "block_ids": ["p0_b1", "p0_b2"],
-        "engines": ["datalab"],
-        "min_confidence": 0.95
-      }}
-    }},
-    {{
-      "kind": "image",
-      "bbox": [x0, y0, x1, y1],
-      "image_ref": "slide0_img3.png",
-      "crop_mode": "fit|fill|stretch",
-      "provenance": {{
-        "block_ids": ["p0_b5"],
-        "engines": ["datalab"],
-        "min_confidence": 0.99
-      }}
-    }}
-  ]
-}}
+Element fields (the response schema is enforced):
+- textbox: bbox, role, structure (type "bullets" with items {{text, level, runs}}, or type "paragraphs" with items {{text}}), style_hints, font_hints, provenance.
+- image: bbox, image_ref (copy the block's image_ref), crop_mode, provenance.
+- shape: bbox, shape_type, fill_color, border_color, border_width, provenance.
+- provenance.block_ids lists the ids of the source blocks.
 
 Rules:
 - Never add missing words. Keep OCR text verbatim.
 - Keep tables as images unless the OCR provides clear cell structure.
 - Create shapes only if a block has type="shape_hint" with confidence >= 0.9.
 - Ensure all bboxes are within slide bounds.
-- For bullets, detect indentation by comparing bbox.x0 values.
+- For bullets, detect indentation by comparing bbox.x0 values. Blocks only include "lines" when their lines are indented differently.
 - Leading glyphs: •, -, *, >, numbers followed by . or )
 - When block metadata provides font_name or font_size, include font_hints for the textbox.
-- CRITICAL: You MUST include every block with type="image" as a "kind": "image" element. Do not filter them out.
+- CRITICAL: You MUST include every block with type="image" as a "kind": "image" element. Do not filter them out."""
 
-Output ONLY the JSON object. Do not include markdown formatting, code blocks, or explanatory text."""
+    USER_PROMPT_TEMPLATE = """Slide dimensions:
+- width_px: {width}
+- height_px: {height}
+
+Detected blocks:
+{blocks_json}
+
+""" + PLAN_INSTRUCTIONS
+
+    BATCH_USER_PROMPT_TEMPLATE = """Slides (each with slide_index, width_px, height_px and detected blocks):
+{slides_json}
+
+Plan EACH slide independently. Never move blocks between slides.
+
+""" + PLAN_INSTRUCTIONS + """
+
+Return one entry in "slides" per input slide, tagged with its slide_index."""
+
+    # USER_PROMPT_TEMPLATE pre-split around its {width}, {height} and {blocks_json}
+    # fields (with escaped braces already resolved), so building a prompt is a
+    # plain concatenation instead of a str.format() parse of the whole template
+    _PROMPT_PARTS = tuple(
+        USER_PROMPT_TEMPLATE.format(width="\0", height="\0", blocks_json="\0").split("\0")
+    )
+    _BATCH_PROMPT_PARTS = tuple(BATCH_USER_PROMPT_TEMPLATE.format(slides_json="\0").split("\0"))
+
+    # Gemini structured-output schemas; the model is constrained to emit JSON of
+    # this shape, and _parse_element still validates each element defensively
+    ELEMENT_SCHEMA = {
+        "type": "OBJECT",
+        "properties": {
+            "kind": {"type": "STRING", "enum": ["textbox", "image", "shape"]},
+            "bbox": {"type": "ARRAY", "items": {"type": "NUMBER"}},
+            "role": {
+                "type": "STRING",
+                "enum": ["title", "subtitle", "body", "caption", "footer"],
+            },
+            "structure": {
+                "type": "OBJECT",
+                "properties": {
+                    "type": {"type": "STRING", "enum": ["bullets", "paragraphs"]},
+                    "items": {
+                        "type": "ARRAY",
+                        "items": {
+                            "type": "OBJECT",
+                            "properties": {
+                                "text": {"type": "STRING"},
+                                "level": {"type": "INTEGER"},
+                                "runs": {
+                                    "type": "ARRAY",
+                                    "items": {
+                                        "type": "OBJECT",
+                                        "properties": {
+                                            "text": {"type": "STRING"},
+                                            "bold": {"type": "BOOLEAN"},
+                                            "italic": {"type": "BOOLEAN"},
+                                        },
+                                        "required": ["text"],
+                                    },
+                                },
+                            },
+                            "required": ["text"],
+                        },
+                    },
+                },
+                "required": ["type", "items"],
+            },
+            "style_hints": {
+                "type": "OBJECT",
+                "properties": {
+                    "align": {"type": "STRING", "enum": ["left", "center", "right"]},
+                    "weight": {"type": "STRING", "enum": ["regular", "bold"]},
+                    "size": {"type": "STRING", "enum": ["xs", "sm", "md", "lg", "xl"]},
+                    "vertical_align": {"type": "STRING", "enum": ["top", "middle", "bottom"]},
+                },
+            },
+            "font_hints": {
+                "type": "OBJECT",
+                "properties": {
+                    "name": {"type": "STRING"},
+                    "size": {"type": "INTEGER"},
+                },
+            },
+            "image_ref": {"type": "STRING"},
+            "crop_mode": {"type": "STRING", "enum": ["fit", "fill", "stretch"]},
+            "shape_type": {"type": "STRING", "enum": ["rectangle", "circle", "line", "arrow"]},
+            "fill_color": {"type": "STRING"},
+            "border_color": {"type": "STRING"},
+            "border_width": {"type": "NUMBER"},
+            "provenance": {
+                "type": "OBJECT",
+                "properties": {
+                    "block_ids": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "engines": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "min_confidence": {"type": "NUMBER"},
+                },
+            },
+        },
+        "required": ["kind", "bbox"],
+    }
+
+    RESPONSE_SCHEMA = {
+        "type": "OBJECT",
+        "properties": {"elements": {"type": "ARRAY", "items": ELEMENT_SCHEMA}},
+        "required": ["elements"],
+    }
+
+    BATCH_RESPONSE_SCHEMA = {
+        "type": "OBJECT",
+        "properties": {
+            "slides": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {
+                        "slide_index": {"type": "INTEGER"},
+                        "elements": {"type": "ARRAY", "items": ELEMENT_SCHEMA},
+                    },
+                    "required": ["slide_index", "elements"],
+                },
+            },
+        },
+        "required": ["slides"],
+    }
 
     def __init__(
         self,
@@ -135,10 +227,25 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
                 "Google API key required. Set GEMINI_API_KEY or GOOGLE_API_KEY env var or pass api_key parameter."
             )
 
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = self._shared_client(self.api_key)
         self.model = model
         self.max_tokens = max_tokens
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _shared_client(api_key: str):
+        """
+        Return a Gemini client shared by all converters using api_key.
+
+        Clients are thread-safe and pool their HTTP connections, so reusing
+        one avoids client setup and fresh TLS handshakes per converter.
+        """
+        # Imported lazily: the google-genai SDK is heavy and only needed once a
+        # converter is actually created
+        from google import genai
+
+        return genai.Client(api_key=api_key)
+
     def convert(self, slide: Slide, debug: bool = False) -> SlideElements:
         """
         Convert a slide's blocks into PPTX elements using LLM.
@@ -150,30 +257,244 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
         Returns:
             SlideElements with textboxes, images, and shapes
         """
+        # Trivial slides (no blocks, a single block, or only images) gain nothing
+        # from layout reasoning; the direct conversion is already correct
+        if self._is_trivial(slide):
+            print(f"[LLM] Skipping LLM for trivial slide {slide.page_index} ({len(slide.blocks)} blocks)")
+            elements = self._fallback_convert_blocks(slide)
+            self._recover_images(elements, slide)
+            return SlideElements(slide_index=slide.page_index, elements=elements)
+
         # Prepare blocks JSON
+        blocks_json = json.dumps(
+            self._build_blocks_data(slide), separators=(",", ":"), ensure_ascii=False
+        )
+
+        # Build prompt
+        user_prompt = self._format_prompt(slide.width_px, slide.height_px, blocks_json)
+
+        if debug:
+            debug_dir = Path("output/debug")
+            debug_dir.mkdir(parents=True, exist_ok=True)
+            with open(debug_dir / f"prompt_slide_{slide.page_index}.txt", "w") as f:
+                f.write(f"SYSTEM:\n{self.SYSTEM_PROMPT}\n\nUSER:\n{user_prompt}")
+
+        # Call LLM
+        print(f"[LLM] Processing slide {slide.page_index} with {len(slide.blocks)} blocks")
+        print(f"[LLM] User Prompt Length: {len(user_prompt)}")
+
+        response_text = self._generate(user_prompt, self.RESPONSE_SCHEMA)
+
+        if debug:
+            with open(debug_dir / f"response_slide_{slide.page_index}.txt", "w") as f:
+                f.write(response_text)
+
+        # Parse response
+        try:
+            elements_data = json.loads(response_text)
+            elements = self._build_elements(elements_data.get("elements", []), slide)
+            print(f"[LLM] Generated {len(elements)} elements for slide {slide.page_index}")
+
+        except json.JSONDecodeError as e:
+            print(f"[LLM] Error parsing JSON response: {e}")
+            print(f"[LLM] Response: {response_text[:500]}")
+            print(f"[LLM] Using fallback: direct block conversion")
+            # Fallback: convert blocks directly without LLM
+            elements = self._fallback_convert_blocks(slide)
+
+        # ALWAYS run recovery: Force-include images that may have been skipped
+        # This runs whether LLM succeeded or fallback was used
+        self._recover_images(elements, slide)
+
+        print(f"[LLM] Final element count for slide {slide.page_index}: {len(elements)}")
+        return SlideElements(slide_index=slide.page_index, elements=elements)
+
+    def convert_batch(
+        self, slides: List[Slide], k: int = 4, debug: bool = False
+    ) -> List[SlideElements]:
+        """
+        Convert several slides, packing up to k slides into each LLM request.
+
+        Amortizes per-request overhead and the system prompt across slides,
+        which matters when throughput is bound by requests per minute.
+        Trivial slides skip the LLM as in convert(); slides missing from a
+        batch response fall back to direct block conversion.
+
+        Args:
+            slides: Slides with OCR blocks
+            k: Maximum number of slides per request
+            debug: If True, save prompts and responses to files
+
+        Returns:
+            SlideElements for each slide, in input order
+        """
+        results: Dict[int, SlideElements] = {}
+        pending = []
+        for pos, slide in enumerate(slides):
+            if self._is_trivial(slide):
+                results[pos] = self.convert(slide, debug=debug)
+            else:
+                pending.append(pos)
+
+        # Parsing and post-processing of each batch response runs on a small
+        # thread pool so it overlaps with the next batch's LLM request
+        futures = []
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            for start in range(0, len(pending), max(1, k)):
+                chunk = pending[start:start + max(1, k)]
+                if len(chunk) == 1:
+                    results[chunk[0]] = self.convert(slides[chunk[0]], debug=debug)
+                    continue
+
+                chunk_slides = [slides[pos] for pos in chunk]
+                slides_json = json.dumps(
+                    [
+                        {
+                            "slide_index": slide.page_index,
+                            "width_px": slide.width_px,
+                            "height_px": slide.height_px,
+                            "blocks": self._build_blocks_data(slide),
+                        }
+                        for slide in chunk_slides
+                    ],
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
+                p = self._BATCH_PROMPT_PARTS
+                user_prompt = f"{p[0]}{slides_json}{p[1]}"
+                indices = [slide.page_index for slide in chunk_slides]
+                batch_name = f"{indices[0]}-{indices[-1]}"
+
+                response_path = None
+                if debug:
+                    debug_dir = Path("output/debug")
+                    debug_dir.mkdir(parents=True, exist_ok=True)
+                    with open(debug_dir / f"prompt_batch_{batch_name}.txt", "w") as f:
+                        f.write(f"SYSTEM:\n{self.SYSTEM_PROMPT}\n\nUSER:\n{user_prompt}")
+                    response_path = debug_dir / f"response_batch_{batch_name}.txt"
+
+                print(f"[LLM] Processing slides {indices} in one request")
+                print(f"[LLM] User Prompt Length: {len(user_prompt)}")
+
+                response_text = self._generate(user_prompt, self.BATCH_RESPONSE_SCHEMA)
+
+                future = pool.submit(
+                    self._postprocess_batch, chunk_slides, response_text, response_path
+                )
+                futures.append((chunk, future))
+
+            for chunk, future in futures:
+                chunk_results, lines = future.result()
+                for line in lines:
+                    print(line)
+                for pos, slide_elements in zip(chunk, chunk_results):
+                    results[pos] = slide_elements
+
+        return [results[pos] for pos in range(len(slides))]
+
+    def _postprocess_batch(
+        self,
+        slides: List[Slide],
+        response_text: str,
+        response_path: Optional[Path] = None,
+    ) -> Tuple[List[SlideElements], List[str]]:
+        """
+        Turn one batch response into SlideElements for each of its slides.
+
+        Runs on a pool thread: its log lines are collected and returned for the
+        caller to print, rather than printed here.
+
+        Args:
+            slides: Slides sent in the batch request, in request order
+            response_text: Raw JSON response for the batch
+            response_path: If set, the response is saved there for debugging
+
+        Returns:
+            SlideElements for each slide in the same order as slides, and the
+            log lines produced while building them
+        """
+        _thread_log.lines = lines = []
+        try:
+            return self._build_batch_elements(slides, response_text, response_path), lines
+        finally:
+            _thread_log.lines = None
+
+    def _build_batch_elements(
+        self,
+        slides: List[Slide],
+        response_text: str,
+        response_path: Optional[Path],
+    ) -> List[SlideElements]:
+        """Parse a batch response and build each slide's elements (see _postprocess_batch)."""
+        if response_path is not None:
+            with open(response_path, "w") as f:
+                f.write(response_text)
+
+        plans: Dict[Any, List[Dict[str, Any]]] = {}
+        try:
+            batch_data = json.loads(response_text)
+            for entry in batch_data.get("slides", []):
+                if isinstance(entry, dict):
+                    plans[entry.get("slide_index")] = entry.get("elements", [])
+        except json.JSONDecodeError as e:
+            _log(f"[LLM] Error parsing JSON response: {e}")
+            _log(f"[LLM] Response: {response_text[:500]}")
+
+        results = []
+        for slide in slides:
+            if slide.page_index in plans:
+                elements = self._build_elements(plans[slide.page_index], slide)
+                _log(f"[LLM] Generated {len(elements)} elements for slide {slide.page_index}")
+            else:
+                _log(f"[LLM] No plan for slide {slide.page_index}, using fallback: direct block conversion")
+                elements = self._fallback_convert_blocks(slide)
+
+            self._recover_images(elements, slide)
+            _log(f"[LLM] Final element count for slide {slide.page_index}: {len(elements)}")
+            results.append(SlideElements(slide_index=slide.page_index, elements=elements))
+
+        return results
+
+    @staticmethod
+    def _is_trivial(slide: Slide) -> bool:
+        """Whether the slide has too little content for LLM layout reasoning."""
+        return len(slide.blocks) <= 1 or all(block.type == "image" for block in slide.blocks)
+
+    def _build_blocks_data(self, slide: Slide) -> List[Dict[str, Any]]:
+        """Build the per-block payload describing a slide to the LLM."""
         blocks_data = []
+        round_coords = self._round_coords
         for block in slide.blocks:
+            block_coords = block.bbox.coords
             block_dict = {
                 "id": block.id,
                 "type": block.type,
-                "bbox": block.bbox.to_list(),
+                "bbox": round_coords(block_coords),
                 "confidence": block.confidence,
             }
 
             if block.type == "text":
                 block_dict["text"] = block.text
-                block_dict["lines"] = [
-                    {
-                        "text": line.text,
-                        "bbox": line.bbox.to_list(),
-                        "confidence": line.confidence,
-                    }
-                    for line in block.lines
-                ]
-                if block.metadata.get("font_name"):
-                    block_dict["font_name"] = block.metadata["font_name"]
-                if block.metadata.get("font_size"):
-                    block_dict["font_size"] = block.metadata["font_size"]
+                # Per-line data only helps the LLM when it carries an indentation
+                # signal; otherwise it just duplicates block.text in the prompt
+                block_x0 = block_coords[0]
+                if len(block.lines) > 1 and any(
+                    line.bbox.coords[0] != block_x0 for line in block.lines
+                ):
+                    block_dict["lines"] = [
+                        {
+                            "text": line.text,
+                            "bbox": round_coords(line.bbox.coords),
+                            "confidence": line.confidence,
+                        }
+                        for line in block.lines
+                    ]
+                font_name = block.metadata.get("font_name")
+                if font_name:
+                    block_dict["font_name"] = font_name
+                font_size = block.metadata.get("font_size")
+                if font_size:
+                    block_dict["font_size"] = font_size
             elif block.type == "image":
                 block_dict["image_ref"] = block.image_ref
             elif block.type == "shape_hint":
@@ -181,24 +502,11 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
 
             blocks_data.append(block_dict)
 
-        blocks_json = json.dumps(blocks_data, indent=2, ensure_ascii=False)
-
-        # Build prompt
-        user_prompt = self.USER_PROMPT_TEMPLATE.format(
-            width=slide.width_px,
-            height=slide.height_px,
-            blocks_json=blocks_json,
-        )
+        return blocks_data
 
-        if debug:
-            debug_dir = Path("output/debug")
-            debug_dir.mkdir(parents=True, exist_ok=True)
-            with open(debug_dir / f"prompt_slide_{slide.page_index}.txt", "w") as f:
-                f.write(f"SYSTEM:\n{self.SYSTEM_PROMPT}\n\nUSER:\n{user_prompt}")
-
-        # Call LLM
-        print(f"[LLM] Processing slide {slide.page_index} with {len(slide.blocks)} blocks")
-        print(f"[LLM] User Prompt Length: {len(user_prompt)}")
+    def _generate(self, user_prompt: str, response_schema: Dict[str, Any]) -> str:
+        """Send a prompt to Gemini and return its JSON response text."""
+        from google.genai import types
 
         try:
             response = self.client.models.generate_content(
@@ -208,9 +516,11 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
                     system_instruction=self.SYSTEM_PROMPT,
                     max_output_tokens=self.max_tokens,
                     temperature=0.1,
+                    response_mime_type="application/json",
+                    response_schema=response_schema,
                 ),
             )
-            response_text = response.text
+            return response.text
         except Exception as e:
             print(f"[LLM] Gemini API Error: {e}")
             if hasattr(e, 'details'):
@@ -218,100 +528,87 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
             # Reraise or return empty
             raise e
 
-        if debug:
-            with open(debug_dir / f"response_slide_{slide.page_index}.txt", "w") as f:
-                f.write(response_text)
-
-        # Parse response
+    def _build_elements(
+        self, elements_data: List[Dict[str, Any]], slide: Slide
+    ) -> List[Any]:
+        """Parse LLM element dicts and fill in missing font hints from blocks."""
         elements = []
-        llm_success = False
 
-        try:
-            # Clean response (remove markdown code blocks if present)
-            response_text = response_text.strip()
-
-            # Use regex to find the JSON object (first { to last })
-            import re
-            match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if match:
-                response_text = match.group(0)
-            else:
-                 # Fallback to simple stripping if regex fails (unlikely for valid JSON)
-                if response_text.startswith("```json"):
-                    response_text = response_text[7:]
-                if response_text.startswith("```"):
-                    response_text = response_text[3:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-                response_text = response_text.strip()
+        # Convert to Pydantic models
+        for elem_dict in elements_data:
+            element = self._parse_element(elem_dict)
+            if element:
+                elements.append(element)
 
-            elements_data = json.loads(response_text)
+        # Only index blocks when some textbox actually needs inferred font hints
+        block_lookup = None
+        for element in elements:
+            if isinstance(element, TextBoxElement) and element.font_hints is None:
+                if block_lookup is None:
+                    block_lookup = {block.id: block for block in slide.blocks}
+                font_name, font_size = self._infer_font_hints(
+                    element, block_lookup
+                )
+                if font_name or font_size:
+                    element.font_hints = FontHints(name=font_name, size=font_size)
 
-            # Convert to Pydantic models
-            for elem_dict in elements_data.get("elements", []):
-                element = self._parse_element(elem_dict)
-                if element:
-                    elements.append(element)
-
-            block_lookup = {block.id: block for block in slide.blocks}
-            for element in elements:
-                if isinstance(element, TextBoxElement) and element.font_hints is None:
-                    font_name, font_size = self._infer_font_hints(
-                        element, block_lookup
-                    )
-                    if font_name or font_size:
-                        element.font_hints = FontHints(name=font_name, size=font_size)
+        return elements
 
-            print(f"[LLM] Generated {len(elements)} elements for slide {slide.page_index}")
-            llm_success = True
+    def _format_prompt(self, width: float, height: float, blocks_json: str) -> str:
+        """Fill USER_PROMPT_TEMPLATE from its pre-split parts."""
+        p = self._PROMPT_PARTS
+        return f"{p[0]}{width}{p[1]}{height}{p[2]}{blocks_json}{p[3]}"
 
-        except json.JSONDecodeError as e:
-            print(f"[LLM] Error parsing JSON response: {e}")
-            print(f"[LLM] Response: {response_text[:500]}")
-            print(f"[LLM] Using fallback: direct block conversion")
-            # Fallback: convert blocks directly without LLM
-            elements = self._fallback_convert_blocks(slide)
+    def _recover_images(self, elements: List[Any], slide: Slide) -> None:
+        """
+        Force-include image blocks the element plan skipped.
+
+        Appends an ImageElement for every image block that is neither
+        referenced by an element's provenance nor overlapped by an image.
+        """
+        # Index covered block ids and image centers once instead of rescanning
+        # every element for every image block.
+        covered = set()
+        image_centers = []
+        for elem in elements:
+            if hasattr(elem, 'provenance'):
+                covered.update(elem.provenance.block_ids)
+            if isinstance(elem, ImageElement):
+                x0, y0, x1, y1 = elem.bbox.coords
+                image_centers.append(((x0 + x1) / 2, (y0 + y1) / 2))
 
-        # ALWAYS run recovery: Force-include images that may have been skipped
-        # This runs whether LLM succeeded or fallback was used
         for block in slide.blocks:
-            if block.type == "image":
-                # Check if this block is already represented in the elements
-                is_covered = False
-                for elem in elements:
-                    # Check provenance
-                    if hasattr(elem, 'provenance') and block.id in elem.provenance.block_ids:
-                        is_covered = True
-                        break
-                    # Check bbox overlap (approximate)
-                    if isinstance(elem, ImageElement):
-                        # If centers are close
-                        c1 = [(elem.bbox.coords[0] + elem.bbox.coords[2])/2, (elem.bbox.coords[1] + elem.bbox.coords[3])/2]
-                        c2 = [(block.bbox.coords[0] + block.bbox.coords[2])/2, (block.bbox.coords[1] + block.bbox.coords[3])/2]
-                        dist = ((c1[0]-c2[0])**2 + (c1[1]-c2[1])**2)**0.5
-                        if dist < 50:  # within 50 pixels
-                            is_covered = True
-                            break
-
-                if not is_covered:
-                    print(f"[LLM] Recovering skipped image block: {block.id}")
-                    # Use the image_ref from the block (should be set during extraction/enrichment)
-                    ref = block.image_ref or f"recovered_{block.id.replace('/', '_')}.png"
-
-                    new_elem = ImageElement(
-                        bbox=block.bbox,
-                        image_ref=ref,
-                        crop_mode="fit",
-                        provenance=ElementProvenance(
-                            block_ids=[block.id],
-                            engines=["recovery"],
-                            min_confidence=block.confidence
-                        )
-                    )
-                    elements.append(new_elem)
+            if block.type != "image" or block.id in covered:
+                continue
 
-        print(f"[LLM] Final element count for slide {slide.page_index}: {len(elements)}")
-        return SlideElements(slide_index=slide.page_index, elements=elements)
+            # Check bbox overlap (approximate): centers within 50 pixels
+            x0, y0, x1, y1 = block.bbox.coords
+            cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+            if any((cx - ex) ** 2 + (cy - ey) ** 2 < 2500 for ex, ey in image_centers):
+                continue
+
+            _log(f"[LLM] Recovering skipped image block: {block.id}")
+            # Use the image_ref from the block (should be set during extraction/enrichment)
+            ref = block.image_ref or f"recovered_{block.id.replace('/', '_')}.png"
+
+            new_elem = ImageElement(
+                bbox=block.bbox,
+                image_ref=ref,
+                crop_mode="fit",
+                provenance=ElementProvenance(
+                    block_ids=[block.id],
+                    engines=["recovery"],
+                    min_confidence=block.confidence
+                )
+            )
+            elements.append(new_elem)
+            covered.add(block.id)
+            image_centers.append((cx, cy))
+
+    @staticmethod
+    def _round_coords(coords: List[float]) -> List[int]:
+        """Round bbox coordinates to whole pixels to keep the prompt compact."""
+        return [int(round(c)) for c in coords]
 
     def _parse_element(self, elem_dict: Dict[str, Any]) -> Optional[Any]:
         """Parse a single element from LLM response."""
@@ -351,7 +648,10 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
                                 )
                             )
                 else:  # paragraphs
-                    items = [str(item) for item in items_data]
+                    items = [
+                        item.get("text", "") if isinstance(item, dict) else str(item)
+                        for item in items_data
+                    ]
 
                 structure = TextStructure(type=structure_type, items=items)
 
@@ -414,7 +714,7 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
                 )
 
         except (KeyError, ValueError) as e:
-            print(f"[LLM] Warning: Failed to parse element: {e}")
+            _log(f"[LLM] Warning: Failed to parse element: {e}")
             return None
 
         return None
@@ -423,6 +723,9 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
     def _infer_font_hints(
         element: TextBoxElement, block_lookup: Dict[str, Block]
     ) -> tuple:
+        if not element.provenance.block_ids:
+            return None, None
+
         font_names = []
         font_sizes = []
         for block_id in element.provenance.block_ids:
@@ -525,5 +828,5 @@ Output ONLY the JSON object. Do not include markdown formatting, code blocks, or
                 )
                 elements.append(element)
 
-        print(f"[LLM] Fallback created {len(elements)} elements from {len(slide.blocks)} blocks")
+        _log(f"[LLM] Fallback created {len(elements)} elements from {len(slide.blocks)} blocks")
         return elements
@@ -4,13 +4,25 @@ PPTX renderer using python-pptx.
 Converts SlideElements into editable PowerPoint slides.
 """
 
+import copy
+import functools
+import io
+import os
 import re
+import struct
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import FrozenSet, List, Dict, Tuple, Optional
+from xml.sax.saxutils import escape, quoteattr
+import numpy as np
 from PIL import Image
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, PP_PARAGRAPH_ALIGNMENT, MSO_ANCHOR
+from tqdm import tqdm
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Pt
+from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 from sliderefactor.models import (
@@ -18,164 +30,196 @@ from sliderefactor.models import (
     TextBoxElement,
     ImageElement,
     ShapeElement,
-    TableElement,
-    TableCell,
     BulletItem,
+    TextRun,
     Slide,
 )
 
 
-def strip_html_tags(text: str) -> str:
-    """Strip HTML tags from text and convert common entities."""
-    if not text:
-        return text
-    # Replace <br> tags with newlines
-    text = re.sub(r'<br\s*/?>', '\n', text)
-
-    # Replace closing block tags with newlines to prevent word merging
-    text = re.sub(r'</p>', '\n', text)
-    text = re.sub(r'</div>', '\n', text)
-    text = re.sub(r'</h1>', '\n', text)
-    text = re.sub(r'</h2>', '\n', text)
-    text = re.sub(r'</h3>', '\n', text)
-
-    # Remove all remaining HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Convert common HTML entities
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    return text.strip()
+# EMU per inch; python-pptx accepts plain int EMUs wherever it takes a Length
+_EMU_PER_INCH = 914400
+
+# Paragraph alignment by style hint (anything else aligns left)
+_ALIGN_MAP = {
+    "center": PP_PARAGRAPH_ALIGNMENT.CENTER,
+    "right": PP_PARAGRAPH_ALIGNMENT.RIGHT,
+}
+
+# Extra width given to text boxes to prevent premature wrapping (0.2")
+_TEXTBOX_EXTRA_WIDTH_EMU = int(0.2 * _EMU_PER_INCH)
+
+# Textbox vertical anchors by style hint (anything else anchors to the top)
+_VANCHOR_MAP = {
+    "middle": MSO_ANCHOR.MIDDLE,
+    "bottom": MSO_ANCHOR.BOTTOM,
+}
 
+# DrawingML algn values by style hint (anything else is "l")
+_ALGN_XML = {
+    "center": "ctr",
+    "right": "r",
+}
 
-# Font mapping: PDF internal names -> PowerPoint-compatible names
-FONT_MAPPING = {
-    # Arial variants
-    "arialmt": "Arial",
-    "arial-boldmt": "Arial",
-    "arial-italicmt": "Arial",
-    "arial-bolditalicmt": "Arial",
-    "arialmtbold": "Arial",
-    "arialnarrow": "Arial Narrow",
-    "arialblack": "Arial Black",
-    # Times variants
-    "timesnewromanpsmt": "Times New Roman",
-    "timesnewromanps-boldmt": "Times New Roman",
-    "timesnewromanps-italicmt": "Times New Roman",
-    "timesnewroman": "Times New Roman",
-    "times": "Times New Roman",
-    # Helvetica -> Arial (common substitution)
-    "helvetica": "Arial",
-    "helveticaneue": "Arial",
-    "helveticaneue-light": "Arial",
-    "helveticaneue-bold": "Arial",
-    "helveticaneue-medium": "Arial",
-    # Calibri variants
-    "calibri": "Calibri",
-    "calibri-bold": "Calibri",
-    "calibri-italic": "Calibri",
-    "calibri-light": "Calibri Light",
-    # Cambria
-    "cambria": "Cambria",
-    "cambriamath": "Cambria Math",
-    # Georgia
-    "georgia": "Georgia",
-    "georgia-bold": "Georgia",
-    # Verdana
-    "verdana": "Verdana",
-    "verdana-bold": "Verdana",
-    # Tahoma
-    "tahoma": "Tahoma",
-    "tahoma-bold": "Tahoma",
-    # Trebuchet
-    "trebuchetms": "Trebuchet MS",
-    "trebuchetms-bold": "Trebuchet MS",
-    # Courier/Consolas (monospace)
-    "couriernew": "Courier New",
-    "couriernewpsmt": "Courier New",
-    "courier": "Courier New",
-    "consolas": "Consolas",
-    # Open Sans
-    "opensans": "Open Sans",
-    "opensans-regular": "Open Sans",
-    "opensans-bold": "Open Sans",
-    "opensans-light": "Open Sans",
-    # Roboto
-    "roboto": "Roboto",
-    "roboto-regular": "Roboto",
-    "roboto-bold": "Roboto",
-    "roboto-light": "Roboto",
-    # Segoe UI
-    "segoeui": "Segoe UI",
-    "segoeui-bold": "Segoe UI",
-    "segoeui-light": "Segoe UI Light",
-    # Source Sans
-    "sourcesanspro": "Source Sans Pro",
-    "sourcesanspro-regular": "Source Sans Pro",
-    # Lato
-    "lato": "Lato",
-    "lato-regular": "Lato",
-    "lato-bold": "Lato",
+# Control characters python-pptx would rewrite as _xHHHH_ escapes; text holding
+# them goes through the object model instead of _paragraphs_xml
+_CTRL_CHAR_RE = re.compile(r'[\x00-\x08\x0c-\x1f]')
+_LINE_BREAK_RE = re.compile(r'[\n\v]')
+
+# Autoshape by ShapeElement.shape_type (anything else is a rectangle)
+_SHAPE_TYPE_MAP = {
+    "rectangle": MSO_SHAPE.RECTANGLE,
+    "circle": MSO_SHAPE.OVAL,
+    "line": MSO_SHAPE.ROUNDED_RECTANGLE,  # Placeholder
+    "arrow": MSO_SHAPE.RIGHT_ARROW,
 }
 
-# Default fallback font
-DEFAULT_FONT = "Calibri"
+
+class _SafeNameTable(dict):
+    r"""
+    str.translate table mapping non-word characters (other than '-') to '_'.
+
+    Same result as re.sub(r'[^\w\-]', '_', ...): \w is str.isalnum() plus
+    '_'. Entries are filled in on first use since names may be any Unicode.
+    """
+
+    def __missing__(self, code: int) -> int:
+        value = code if chr(code).isalnum() or code in (0x5F, 0x2D) else 0x5F
+        self[code] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+# Extensions a cropped image filename may already carry
+_IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
 
 
-def normalize_font_name(pdf_font_name: Optional[str]) -> str:
+@functools.lru_cache(maxsize=256)
+def _pt(size: float) -> Pt:
+    """Memoized Pt(); a deck only uses a handful of distinct font sizes."""
+    return Pt(size)
+
+
+def _png_size(path: Path) -> Optional[Tuple[int, int]]:
     """
-    Normalize a PDF font name to a PowerPoint-compatible font name.
+    Read a PNG's pixel size from its IHDR header without decoding it.
 
-    PDF fonts often have internal names like 'ArialMT', 'TimesNewRomanPS-BoldMT',
-    'BCDEEE+Calibri', etc. This function maps them to standard names.
+    Returns:
+        (width, height), or None if the file is not a PNG
     """
-    if not pdf_font_name:
-        return DEFAULT_FONT
-
-    # Remove common PDF font prefixes (subset prefixes like 'BCDEEE+')
-    clean_name = re.sub(r'^[A-Z]{6}\+', '', pdf_font_name)
-
-    # Normalize: lowercase, remove spaces and hyphens for matching
-    normalized = clean_name.lower().replace(' ', '').replace('-', '').replace('_', '')
-
-    # Check direct mapping
-    if normalized in FONT_MAPPING:
-        return FONT_MAPPING[normalized]
-
-    # Check if any mapping key is contained in the normalized name
-    for key, value in FONT_MAPPING.items():
-        if key in normalized:
-            return value
-
-    # Check for common font family names
-    common_families = [
-        ("arial", "Arial"),
-        ("helvetica", "Arial"),
-        ("times", "Times New Roman"),
-        ("calibri", "Calibri"),
-        ("cambria", "Cambria"),
-        ("georgia", "Georgia"),
-        ("verdana", "Verdana"),
-        ("tahoma", "Tahoma"),
-        ("trebuchet", "Trebuchet MS"),
-        ("courier", "Courier New"),
-        ("consolas", "Consolas"),
-        ("segoe", "Segoe UI"),
-        ("roboto", "Roboto"),
-        ("opensans", "Open Sans"),
-        ("lato", "Lato"),
-    ]
-
-    for pattern, replacement in common_families:
-        if pattern in normalized:
-            return replacement
-
-    # If no match found, return the original (cleaned) name
-    # PowerPoint will use a fallback if it doesn't recognize the font
-    return clean_name if clean_name else DEFAULT_FONT
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_hex_color(hex_color: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a hex color string (memoized; decks reuse a few colors).
+
+    Returns:
+        (r, g, b) components, or None if the string is not a 6-digit hex color
+    """
+    hex_color = hex_color.lstrip("#")
+    if len(hex_color) != 6:
+        return None
+    try:
+        value = int(hex_color, 16)
+    except ValueError:
+        return None
+    if value < 0:
+        return None
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+def _paragraphs_xml(texts: List[str], algn: str, r_pr: str) -> Optional[str]:
+    """
+    Build an a:txBody fragment with one uniformly styled paragraph per text.
+
+    Produces the same markup as setting p.text and styling every run: line
+    breaks become <a:br/> between runs and empty segments get no run.
+
+    Args:
+        texts: Paragraph texts (already stripped of HTML)
+        algn: DrawingML paragraph alignment ("l", "ctr" or "r")
+        r_pr: Serialized <a:rPr> applied to every run
+
+    Returns:
+        The XML string, or None if a text needs python-pptx's control-character escaping
+    """
+    paragraphs = []
+    for text in texts:
+        if _CTRL_CHAR_RE.search(text):
+            return None
+        parts = []
+        for idx, segment in enumerate(_LINE_BREAK_RE.split(text)):
+            if idx:
+                parts.append('<a:br/>')
+            if segment:
+                parts.append(f'<a:r>{r_pr}<a:t>{escape(segment)}</a:t></a:r>')
+        paragraphs.append(f'<a:p><a:pPr algn="{algn}"/>{"".join(parts)}</a:p>')
+    return f'<a:txBody {nsdecls("a")}>{"".join(paragraphs)}</a:txBody>'
+
+
+def _bboxes_to_emu(bboxes: np.ndarray, kx: float, ky: float) -> np.ndarray:
+    """
+    Convert pixel bboxes to EMU boxes in one vectorized pass.
+
+    Args:
+        bboxes: (N, 4) array of [x0, y0, x1, y1] in pixels
+        kx: Horizontal EMU per pixel
+        ky: Vertical EMU per pixel
+
+    Returns:
+        (N, 4) int64 array of [left, top, width, height] in EMU
+    """
+    origin = bboxes[:, :2]
+    boxes = np.concatenate((origin, bboxes[:, 2:] - origin), axis=1)
+    boxes *= (kx, ky, kx, ky)
+    return boxes.astype(np.int64)
+
+
+# Precompiled patterns for strip_html_tags
+_BR_RE = re.compile(r'<br\s*/?>')
+_BLOCK_CLOSE_RE = re.compile(r'</(?:p|div|h[1-3])>')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Common HTML entities and their characters
+_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&nbsp;': ' ',
+    '&quot;': '"',
+    '&#39;': "'",
+}
+_ENTITY_RE = re.compile('|'.join(map(re.escape, _ENTITIES)))
+
+
+def _replace_entity(match: re.Match) -> str:
+    return _ENTITIES[match.group(0)]
+
+
+def strip_html_tags(text: str) -> str:
+    """Strip HTML tags from text and convert common entities."""
+    if not text:
+        return text
+    # Most OCR text has no markup at all; only run the passes that can match
+    if '<' in text:
+        # Replace <br> tags with newlines
+        text = _BR_RE.sub('\n', text)
+
+        # Replace closing block tags with newlines to prevent word merging
+        text = _BLOCK_CLOSE_RE.sub('\n', text)
+
+        # Remove all remaining HTML tags
+        text = _TAG_RE.sub('', text)
+    if '&' in text:
+        # Convert common HTML entities in a single pass
+        text = _ENTITY_RE.sub(_replace_entity, text)
+    return text.strip()
 
 
 class PPTXRenderer:
@@ -213,6 +257,8 @@ class PPTXRenderer:
         slide_height_inches: float = 7.5,
         dpi: int = 96,
         render_background: bool = True,
+        workers: Optional[int] = 1,
+        verbose: bool = False,
     ):
         """
         Initialize renderer.
@@ -222,11 +268,51 @@ class PPTXRenderer:
             slide_height_inches: Slide height in inches
             dpi: DPI for pixel-to-inch conversion
             render_background: Whether to render background images (disable to avoid "double text")
+            workers: Processes used to build slides in parallel (None = one per CPU,
+                1 = render serially in this process)
+            verbose: Show a per-slide progress bar and per-element debug output
+                while rendering
         """
         self.slide_width_inches = slide_width_inches
         self.slide_height_inches = slide_height_inches
         self.dpi = dpi
         self.render_background = render_background
+        self.workers = workers
+        self.verbose = verbose
+        # Image bytes by path for the current render, for repeated images (logos,
+        # footers) only; python-pptx keeps its own copy of every image part, so
+        # single-use images are not held a second time
+        self._image_cache: Dict[Path, bytes] = {}
+        # Image refs (elements and backgrounds) used more than once in the deck
+        self._shared_refs: FrozenSet[str] = frozenset()
+        # Resolved paths of the image refs that exist on disk, for the current render
+        self._image_paths: Dict[str, Path] = {}
+        # Decoded page images for the crop fallback, so several crops from one
+        # page decode its PNG once; closed when render() finishes
+        self._page_image_cache: Dict[Path, Image.Image] = {}
+        # Crop fallback results from the render pre-pass, by image_ref
+        self._crop_paths: Dict[str, Optional[Path]] = {}
+        # Names of the files in images_dir, listed once per render so existence
+        # checks are set lookups rather than a stat per element
+        self._image_names: FrozenSet[str] = frozenset()
+        # Font size per SIZE_MAP key for the current slide height
+        self._size_pt: Dict[str, Pt] = self._build_size_table()
+        # Slide size in EMU, for full-slide shapes such as the background
+        self._slide_emu: Tuple[int, int] = self._slide_size_emu()
+
+    def _build_size_table(self) -> Dict[str, Pt]:
+        """Map each SIZE_MAP key to its font size for the current slide height."""
+        # Use output slide height in POINTS (not pixels) for proper font sizing
+        # 1 inch = 72 points
+        slide_height_pt = self.slide_height_inches * 72
+        return {key: Pt(int(ratio * slide_height_pt)) for key, ratio in self.SIZE_MAP.items()}
+
+    def _slide_size_emu(self) -> Tuple[int, int]:
+        """Slide (width, height) in EMU for the current slide size."""
+        return (
+            int(self.slide_width_inches * _EMU_PER_INCH),
+            int(self.slide_height_inches * _EMU_PER_INCH),
+        )
 
     def render(
         self,
@@ -263,58 +349,152 @@ class PPTXRenderer:
             print(f"[PPTX] Slide dimensions: {self.slide_width_inches:.2f}\" x {self.slide_height_inches:.2f}\"")
 
         # Set slide dimensions
-        prs.slide_width = Inches(self.slide_width_inches)
-        prs.slide_height = Inches(self.slide_height_inches)
+        self._slide_emu = self._slide_size_emu()
+        prs.slide_width, prs.slide_height = self._slide_emu
+        self._size_pt = self._build_size_table()
 
         print(f"[PPTX] Rendering {len(elements_list)} slides")
 
-        for i, (elements, slide_info) in enumerate(zip(elements_list, slides_info)):
-            print(
-                f"[PPTX] Rendering slide {i + 1}/{len(elements_list)} ({len(elements.elements)} elements)"
-            )
+        self._image_names = self._list_images(images_dir)
+        self._image_paths = self._resolve_images(
+            elements_list, slides_info, images_dir, self._image_names
+        )
+        # All crop-fallback files are written here, before any slide is built
+        self._crop_paths = self._prepare_crops(elements_list, slides_info, images_dir)
+
+        workers = self.workers if self.workers is not None else (os.cpu_count() or 1)
+        if workers > 1 and len(elements_list) > 1:
+            self._render_parallel(prs, elements_list, slides_info, images_dir, workers)
+        else:
+            self._shared_refs = self._shared_image_refs(elements_list, slides_info)
 
             # Use blank slide layout
             slide_layout = prs.slide_layouts[6]  # Blank layout
-            slide = prs.slides.add_slide(slide_layout)
-
-            # Render background if present and enabled
-            if self.render_background and slide_info.background.mode == "image" and slide_info.background.image_ref:
-                self._render_background(slide, slide_info, images_dir)
-
-            # Render each element
-            for element in elements.elements:
-                if isinstance(element, TextBoxElement):
-                    self._render_textbox(element, slide, slide_info)
-                elif isinstance(element, ImageElement):
-                    self._render_image(element, slide, slide_info, images_dir)
-                elif isinstance(element, ShapeElement):
-                    self._render_shape(element, slide, slide_info)
-                elif isinstance(element, TableElement):
-                    self._render_table(element, slide, slide_info)
+            add_slide = prs.slides.add_slide
+            render_slide = self._render_slide
+            progress = tqdm(
+                zip(elements_list, slides_info),
+                total=len(elements_list),
+                desc="[PPTX] Rendering slides",
+                unit="slide",
+                disable=not self.verbose,
+            )
+            for elements, slide_info in progress:
+                slide = add_slide(slide_layout)
+                render_slide(elements, slide, slide_info, images_dir)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        prs.save(str(output_path))
+        # Zip in memory and write the file in one go rather than as many small writes
+        buf = io.BytesIO()
+        prs.save(buf)
+        output_path.write_bytes(buf.getvalue())
+        self._image_cache.clear()
+        self._shared_refs = frozenset()
+        self._image_paths = {}
+        self._crop_paths = {}
+        self._image_names = frozenset()
+        self._close_page_images()
 
         print(f"[PPTX] Saved presentation to {output_path}")
         return output_path
 
-    def _render_textbox(
-        self, element: TextBoxElement, slide, slide_info: Slide
+    def _render_parallel(
+        self,
+        prs,
+        elements_list: List[SlideElements],
+        slides_info: List[Slide],
+        images_dir: Path,
+        workers: int,
     ) -> None:
-        """Render a text box element."""
-        # Convert bbox from pixels to inches
-        print(f"[PPTX] Debug: Slide px={slide_info.width_px}x{slide_info.height_px}, BBox={element.bbox.to_list()[:2]}")
-        left, top, width, height = self._bbox_to_inches(
-            element.bbox.to_list(),
-            slide_info.width_px,
-            slide_info.height_px,
+        """
+        Build slides in worker processes and stitch them into prs in order.
+
+        Slide construction is pure-Python XML work, so separate processes
+        scale it across cores; each worker returns a one-slide PPTX. Workers
+        only read images: missing ones were already cropped by render().
+        """
+        print(f"[PPTX] Building slides with {workers} worker processes")
+        config = (
+            self.slide_width_inches,
+            self.slide_height_inches,
+            self.dpi,
+            self.render_background,
         )
+        n = len(elements_list)
+        # Each worker gets the crop results for its own slide's image refs
+        crop_maps = []
+        for elements in elements_list:
+            crop_map = {}
+            for element in elements.elements:
+                if type(element) is ImageElement and element.image_ref in self._crop_paths:
+                    crop_map[element.image_ref] = self._crop_paths[element.image_ref]
+            crop_maps.append(crop_map)
+        slide_layout = prs.slide_layouts[6]  # Blank layout
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            slide_parts = executor.map(
+                _render_slide_part,
+                [config] * n,
+                elements_list,
+                slides_info,
+                [images_dir] * n,
+                [self._image_names] * n,
+                crop_maps,
+            )
+            progress = tqdm(
+                slide_parts,
+                total=n,
+                desc="[PPTX] Rendering slides",
+                unit="slide",
+                disable=not self.verbose,
+            )
+            for slide_bytes in progress:
+                _append_slide_part(prs, slide_layout, slide_bytes)
+
+    def _render_slide(
+        self, elements: SlideElements, slide, slide_info: Slide, images_dir: Path
+    ) -> None:
+        """Render a slide's background and elements onto a blank slide."""
+        # Convert every element bbox on the slide from pixels to EMU in one pass
+        kx, ky = self._compute_scale(slide_info)
+        emus = _bboxes_to_emu(
+            np.array([e.bbox.coords for e in elements.elements], dtype=np.float64).reshape(-1, 4),
+            kx,
+            ky,
+        ).tolist()
+
+        # Render background if present and enabled
+        if self.render_background and slide_info.background.mode == "image" and slide_info.background.image_ref:
+            self._render_background(slide, slide_info, images_dir)
+
+        # Render each element; element models are final classes, so the exact
+        # type() picks the handler. Tables have no renderer yet and are skipped.
+        handlers = {
+            TextBoxElement: self._render_textbox,
+            ImageElement: lambda e, s, si, emu: self._render_image(e, s, si, images_dir, emu),
+            ShapeElement: self._render_shape,
+        }
+        get_handler = handlers.get
+        for element, emu in zip(elements.elements, emus):
+            handler = get_handler(type(element))
+            if handler is not None:
+                handler(element, slide, slide_info, emu)
+
+    def _render_textbox(
+        self,
+        element: TextBoxElement,
+        slide,
+        slide_info: Slide,
+        emu: List[int],
+    ) -> None:
+        """Render a text box element at emu = (left, top, width, height)."""
+        if self.verbose:
+            print(f"[PPTX] Debug: Slide px={slide_info.width_px}x{slide_info.height_px}, BBox={element.bbox.coords[:2]}")
+        left, top, width, height = emu
 
         # Add text box
         # Slightly widen the box to prevent premature wrapping
-        width += 0.2
         textbox = slide.shapes.add_textbox(
-            Inches(left), Inches(top), Inches(width), Inches(height)
+            left, top, width + _TEXTBOX_EXTRA_WIDTH_EMU, height
         )
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
@@ -326,19 +506,13 @@ class PPTXRenderer:
         text_frame.margin_bottom = 0
 
         # Set vertical alignment
-        if element.style_hints.vertical_align == "middle":
-            text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-        elif element.style_hints.vertical_align == "bottom":
-            text_frame.vertical_anchor = MSO_ANCHOR.BOTTOM
-        else:
-            text_frame.vertical_anchor = MSO_ANCHOR.TOP
+        text_frame.vertical_anchor = _VANCHOR_MAP.get(
+            element.style_hints.vertical_align, MSO_ANCHOR.TOP
+        )
 
         # Determine font size
-        # Use output slide height in POINTS (not pixels) for proper font sizing
-        # 1 inch = 72 points
-        slide_height_pt = self.slide_height_inches * 72
         size_key = element.style_hints.size or self.ROLE_SIZE_MAP.get(element.role, "md")
-        font_size = int(self.SIZE_MAP[size_key] * slide_height_pt)
+        size_pt = self._size_pt[size_key]
 
         # Add content
         if element.structure.type == "bullets":
@@ -346,7 +520,7 @@ class PPTXRenderer:
                 text_frame,
                 element.structure.items,
                 element.style_hints,
-                font_size,
+                size_pt,
                 element.font_hints,
             )
         else:  # paragraphs
@@ -354,7 +528,7 @@ class PPTXRenderer:
                 text_frame,
                 element.structure.items,
                 element.style_hints,
-                font_size,
+                size_pt,
                 element.font_hints,
             )
 
@@ -363,293 +537,575 @@ class PPTXRenderer:
         text_frame,
         items: List[BulletItem],
         style_hints,
-        font_size: int,
+        size_pt: Pt,
         font_hints,
     ) -> None:
         """Add bullet points to text frame."""
-        text_frame.clear()  # Remove default paragraph
+        # A new textbox holds exactly one empty paragraph, reused for the first item
+        assert len(text_frame.paragraphs) == 1
+
+        # Paragraph-level styling is the same for every bullet
+        align_enum = _ALIGN_MAP.get(style_hints.align, PP_PARAGRAPH_ALIGNMENT.LEFT)
+        force_bold = style_hints.weight == "bold"
+        # Size for runs without their own; shared Length object for every run
+        default_pt = _pt(font_hints.size) if font_hints and font_hints.size else size_pt
+        # Model font names are already normalized for PowerPoint
+        font_name = font_hints.name if font_hints else None
+
+        # Plain string lists need none of the per-item BulletItem handling
+        if items and isinstance(items[0], str) and all(isinstance(x, str) for x in items):
+            self._add_string_bullets(text_frame, items, align_enum, default_pt, font_name, force_bold)
+            return
 
         for i, item in enumerate(items):
-            if isinstance(item, str):
-                # Simple string bullet
-                p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-                p.text = strip_html_tags(item)
-                p.level = 0
-            elif isinstance(item, BulletItem):
-                p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+
+            if isinstance(item, BulletItem) and item.runs:
                 p.level = item.level
 
-                # Add runs
-                if item.runs:
-                    for run_data in item.runs:
-                        run = p.add_run()
-                        run.text = strip_html_tags(run_data.text)
-
-                        if run_data.bold:
-                            run.font.bold = True
-                        if run_data.italic:
-                            run.font.italic = True
-                        if run_data.underline:
-                            run.font.underline = True
-                        if run_data.font_size:
-                            run.font.size = Pt(run_data.font_size)
-                        elif font_hints and font_hints.size:
-                            run.font.size = Pt(font_hints.size)
-                        else:
-                            run.font.size = Pt(font_size)
-                        if run_data.font_name:
-                            run.font.name = normalize_font_name(run_data.font_name)
-                        elif font_hints and font_hints.name:
-                            run.font.name = normalize_font_name(font_hints.name)
+                # Add runs; identically formatted runs collapse into a single run
+                if len(item.runs) > 1 and self._runs_are_uniform(item.runs):
+                    run_specs = [
+                        (item.runs[0], "".join(strip_html_tags(rd.text) for rd in item.runs))
+                    ]
                 else:
-                    # No runs, just set text
+                    run_specs = [(rd, strip_html_tags(rd.text)) for rd in item.runs]
+
+                for run_data, run_text in run_specs:
+                    run = p.add_run()
+                    run.text = run_text
+
+                    if run_data.bold or force_bold:
+                        run.font.bold = True
+                    if run_data.italic:
+                        run.font.italic = True
+                    if run_data.underline:
+                        run.font.underline = True
+                    if run_data.font_size:
+                        run.font.size = _pt(run_data.font_size)
+                    else:
+                        run.font.size = default_pt
+                    if run_data.font_name:
+                        run.font.name = run_data.font_name
+                    elif font_name:
+                        run.font.name = font_name
+            else:
+                # Simple string bullet, or a bullet without runs: just set text
+                if isinstance(item, BulletItem):
+                    p.level = item.level
                     p.text = strip_html_tags(item.text)
+                else:
+                    p.level = 0
+                    p.text = strip_html_tags(item)
+
+                # Setting p.text creates fresh runs (one per line, none for empty
+                # text), so every run still needs the default size
+                for run in p.runs:
+                    run.font.size = default_pt
+                    if font_name:
+                        run.font.name = font_name
+                    if force_bold:
+                        run.font.bold = True
 
             # Apply paragraph-level styling
-            if style_hints.align == "center":
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-            elif style_hints.align == "right":
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.RIGHT
-            else:
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+            p.alignment = align_enum
 
-            # Set font size for the paragraph
-            if not item.runs if isinstance(item, BulletItem) else True:
-                for run in p.runs:
-                    if run.font.size is None:
-                        if font_hints and font_hints.size:
-                            run.font.size = Pt(font_hints.size)
-                        else:
-                            run.font.size = Pt(font_size)
-                    if font_hints and font_hints.name:
-                        run.font.name = normalize_font_name(font_hints.name)
-
-            # Apply weight
-            if style_hints.weight == "bold":
-                for run in p.runs:
+    @staticmethod
+    def _add_string_bullets(
+        text_frame,
+        items: List[str],
+        align_enum,
+        default_pt: Pt,
+        font_name: Optional[str],
+        force_bold: bool,
+    ) -> None:
+        """Fast path of _add_bullets for a list of plain strings."""
+        for i, text in enumerate(items):
+            p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+            p.text = strip_html_tags(text)
+            p.level = 0
+            p.alignment = align_enum
+            for run in p.runs:
+                run.font.size = default_pt
+                if font_name:
+                    run.font.name = font_name
+                if force_bold:
                     run.font.bold = True
 
+    @staticmethod
+    def _runs_are_uniform(runs: List[TextRun]) -> bool:
+        """Whether all runs share the formatting the renderer applies per run."""
+        first = runs[0]
+        key = (first.bold, first.italic, first.underline, first.font_size, first.font_name)
+        return all(
+            (r.bold, r.italic, r.underline, r.font_size, r.font_name) == key for r in runs
+        )
+
     def _add_paragraphs(
         self,
         text_frame,
         items: List[str],
         style_hints,
-        font_size: int,
+        size_pt: Pt,
         font_hints,
     ) -> None:
         """Add paragraphs to text frame."""
-        text_frame.clear()
+        # A new textbox holds exactly one empty paragraph, reused for the first item
+        assert len(text_frame.paragraphs) == 1
+
+        # Styling is the same for every paragraph
+        force_bold = bool((font_hints and font_hints.bold) or style_hints.weight == "bold")
+        default_pt = _pt(font_hints.size) if font_hints and font_hints.size else size_pt
+        # Model font names are already normalized for PowerPoint
+        font_name = font_hints.name if font_hints else None
+        italic = bool(font_hints and font_hints.italic)
+        rgb = _parse_hex_color(font_hints.color) if font_hints and font_hints.color else None
+        color = RGBColor(*rgb) if rgb else None
+
+        # Every run is styled the same, so build the paragraphs as one XML
+        # fragment instead of setting each property through python-pptx
+        texts = [strip_html_tags(str(text)) for text in items]
+        r_pr = self._run_properties_xml(default_pt, font_name, force_bold, italic, color)
+        xml = _paragraphs_xml(texts, _ALGN_XML.get(style_hints.align, "l"), r_pr) if texts else None
+        if xml is not None:
+            tx_body = text_frame._txBody
+            for p in tx_body.p_lst:
+                tx_body.remove(p)
+            tx_body.extend(list(parse_xml(xml)))
+            return
 
-        for i, text in enumerate(items):
+        align_enum = _ALIGN_MAP.get(style_hints.align, PP_PARAGRAPH_ALIGNMENT.LEFT)
+        for i, text in enumerate(texts):
             p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
-            # Strip HTML tags from text
-            p.text = strip_html_tags(str(text))
+            p.text = text
 
             # Apply styling
-            if style_hints.align == "center":
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-            elif style_hints.align == "right":
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.RIGHT
-            else:
-                p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+            p.alignment = align_enum
 
             for run in p.runs:
                 # Apply font size
-                if font_hints and font_hints.size:
-                    run.font.size = Pt(font_hints.size)
-                else:
-                    run.font.size = Pt(font_size)
+                run.font.size = default_pt
                 
                 # Apply font name
-                if font_hints and font_hints.name:
-                    run.font.name = normalize_font_name(font_hints.name)
+                if font_name:
+                    run.font.name = font_name
                 
                 # Apply bold (from font_hints or style_hints)
-                if (font_hints and font_hints.bold) or style_hints.weight == "bold":
+                if force_bold:
                     run.font.bold = True
                 
                 # Apply italic
-                if font_hints and font_hints.italic:
+                if italic:
                     run.font.italic = True
                 
                 # Apply color
-                if font_hints and font_hints.color:
-                    color = self._parse_hex_color(font_hints.color)
-                    if color:
-                        run.font.color.rgb = color
+                if color:
+                    run.font.color.rgb = color
+
+    @staticmethod
+    def _run_properties_xml(
+        size_pt: Pt,
+        font_name: Optional[str],
+        bold: bool,
+        italic: bool,
+        color: Optional[RGBColor],
+    ) -> str:
+        """Serialize the <a:rPr> that _add_paragraphs applies to every run."""
+        attrs = f' sz="{size_pt.centipoints}"'
+        if bold:
+            attrs += ' b="1"'
+        if italic:
+            attrs += ' i="1"'
+        # Child order follows the CT_TextCharacterProperties schema
+        children = ""
+        if color:
+            children += f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+        if font_name:
+            children += f'<a:latin typeface={quoteattr(font_name)}/>'
+        return f'<a:rPr{attrs}>{children}</a:rPr>' if children else f'<a:rPr{attrs}/>'
 
     def _render_image(
-        self, element: ImageElement, slide, slide_info: Slide, images_dir: Path
+        self,
+        element: ImageElement,
+        slide,
+        slide_info: Slide,
+        images_dir: Path,
+        emu: List[int],
     ) -> None:
-        """Render an image element."""
+        """Render an image element at emu = (left, top, width, height)."""
         # Find image file
-        image_path = images_dir / element.image_ref
-
-        if not image_path.exists():
-            # Fallback: Try to crop from full page image
-            page_image_path = images_dir / f"page_{slide_info.page_index}.png"
-            if page_image_path.exists():
-                try:
-                    print(f"[PPTX] Cropping image for {element.image_ref} from {page_image_path}")
-                    with Image.open(page_image_path) as img:
-                        # Calculate scale factor between bbox coordinates and image pixels
-                        # element.bbox is in slide_info.width_px coordinates
-                        scale_x = img.width / slide_info.width_px
-                        scale_y = img.height / slide_info.height_px
-                        
-                        x0, y0, x1, y1 = element.bbox.to_list()
-                        
-                        # Apply scaling to crop box
-                        crop_box = (
-                            int(x0 * scale_x), 
-                            int(y0 * scale_y), 
-                            int(x1 * scale_x), 
-                            int(y1 * scale_y)
-                        )
-                        
-                        # Ensure crop box is valid
-                        if crop_box[2] > crop_box[0] and crop_box[3] > crop_box[1]:
-                            cropped_img = img.crop(crop_box)
-                            
-                            # Create a valid filename
-                            safe_name = re.sub(r'[^\w\-]', '_', str(element.image_ref))
-                            if not safe_name.lower().endswith(('.png', '.jpg', '.jpeg')):
-                                safe_name += ".png"
-                                
-                            image_path = images_dir / safe_name
-                            cropped_img.save(image_path)
-                            print(f"[PPTX] Saved cropped image to {image_path}")
-                        else:
-                            print(f"[PPTX] Warning: Invalid crop box {crop_box}")
-                            return
-                except Exception as e:
-                    print(f"[PPTX] Error cropping image: {e}")
-                    return
-            else:
-                print(f"[PPTX] Warning: Image not found: {image_path} and page image missing")
+        image_path = self._image_paths.get(element.image_ref)
+
+        if image_path is None:
+            # Fallback: the crop from the full page image made by render()'s
+            # pre-pass (None if that failed; it already printed why)
+            image_path = self._crop_paths.get(element.image_ref)
+            if image_path is None:
                 return
 
-        # Convert bbox from pixels to inches
-        left, top, width, height = self._bbox_to_inches(
-            element.bbox.to_list(),
-            slide_info.width_px,
-            slide_info.height_px,
-        )
+        left, top, width, height = emu
 
         try:
             # Add picture
-            slide.shapes.add_picture(
-                str(image_path),
-                Inches(left),
-                Inches(top),
-                width=Inches(width),
-                height=Inches(height),
-            )
+            self._add_picture(slide, image_path, element.image_ref, left, top, width, height)
         except Exception as e:
             print(f"[PPTX] Warning: Failed to add image {image_path}: {e}")
 
+    def _crop_from_page(
+        self, element: ImageElement, slide_info: Slide, images_dir: Path
+    ) -> Optional[Path]:
+        """
+        Crop an image element out of its slide's full page image.
+
+        Args:
+            element: Image element whose image file is missing
+            slide_info: Source slide (bbox coordinates are in its pixel space)
+            images_dir: Directory containing the page images
+
+        Returns:
+            Path of the cropped image, or None if it could not be produced
+        """
+        page_image_path = images_dir / f"page_{slide_info.page_index}.png"
+        # Create a valid filename for the cropped image
+        safe_name = str(element.image_ref).translate(_SAFE_NAME_TABLE)
+        if not safe_name.lower().endswith(_IMAGE_EXTS):
+            safe_name += ".png"
+        crop_path = images_dir / safe_name
+
+        if safe_name in self._image_names:
+            # Cropped by an earlier render; reuse it
+            return crop_path
+        if page_image_path.name not in self._image_names:
+            print(f"[PPTX] Warning: Image not found: {images_dir / element.image_ref} and page image missing")
+            return None
+
+        try:
+            if self.verbose:
+                print(f"[PPTX] Cropping image for {element.image_ref} from {page_image_path}")
+            # Page size from the PNG header, so an invalid crop
+            # returns before the page image is decoded
+            page_size = _png_size(page_image_path)
+            if page_size is None:
+                with Image.open(page_image_path) as img:
+                    page_size = img.size
+
+            # Calculate scale factor between bbox coordinates and image pixels
+            # element.bbox is in slide_info.width_px coordinates
+            scale_x = page_size[0] / slide_info.width_px
+            scale_y = page_size[1] / slide_info.height_px
+            
+            x0, y0, x1, y1 = element.bbox.coords
+            
+            # Apply scaling to crop box
+            crop_box = (
+                int(x0 * scale_x), 
+                int(y0 * scale_y), 
+                int(x1 * scale_x), 
+                int(y1 * scale_y)
+            )
+            
+            # Ensure crop box is valid
+            if not (crop_box[2] > crop_box[0] and crop_box[3] > crop_box[1]):
+                print(f"[PPTX] Warning: Invalid crop box {crop_box}")
+                return None
+
+            img = self._page_image_cache.get(page_image_path)
+            if img is None:
+                img = Image.open(page_image_path)
+                img.load()
+                self._page_image_cache[page_image_path] = img
+            cropped_img = img.crop(crop_box)
+
+            # Fast zlib level: much quicker to encode, only slightly larger
+            cropped_img.save(crop_path, compress_level=1)
+            if self.verbose:
+                print(f"[PPTX] Saved cropped image to {crop_path}")
+            return crop_path
+        except Exception as e:
+            print(f"[PPTX] Error cropping image: {e}")
+            return None
+
+    def _prepare_crops(
+        self,
+        elements_list: List[SlideElements],
+        slides_info: List[Slide],
+        images_dir: Path,
+    ) -> Dict[str, Optional[Path]]:
+        """
+        Run the page-image crop fallback for every missing image up front.
+
+        Decoding, cropping and PNG encoding run in Pillow's C code without the
+        GIL, so pages are processed on a thread pool; the python-pptx slide
+        building that follows stays serial. Each page is handled by a single
+        task, which decodes it once and closes it when its crops are done.
+
+        Returns:
+            Mapping of image_ref to its cropped image path (None if the crop failed)
+        """
+        by_page: Dict[Path, List[Tuple[ImageElement, Slide]]] = {}
+        seen = set()
+        for elements, slide_info in zip(elements_list, slides_info):
+            for element in elements.elements:
+                if type(element) is not ImageElement:
+                    continue
+                ref = element.image_ref
+                if ref in self._image_paths or ref in seen:
+                    continue
+                seen.add(ref)
+                page_image_path = images_dir / f"page_{slide_info.page_index}.png"
+                by_page.setdefault(page_image_path, []).append((element, slide_info))
+
+        if not by_page:
+            return {}
+
+        def crop_page(page_image_path: Path, jobs: List[Tuple[ImageElement, Slide]]):
+            results = [
+                (element.image_ref, self._crop_from_page(element, slide_info, images_dir))
+                for element, slide_info in jobs
+            ]
+            img = self._page_image_cache.pop(page_image_path, None)
+            if img is not None:
+                img.close()
+            return results
+
+        crop_paths: Dict[str, Optional[Path]] = {}
+        workers = min(len(by_page), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(crop_page, by_page.keys(), by_page.values()):
+                crop_paths.update(results)
+        return crop_paths
+
+    def _close_page_images(self) -> None:
+        """Close and drop the decoded page images kept for the crop fallback."""
+        for img in self._page_image_cache.values():
+            img.close()
+        self._page_image_cache.clear()
+
     def _render_background(self, slide, slide_info: Slide, images_dir: Path) -> None:
         """Render slide background image."""
-        image_path = images_dir / slide_info.background.image_ref
-        if not image_path.exists():
-            print(f"[PPTX] Warning: Background image not found: {image_path}")
+        image_path = self._image_paths.get(slide_info.background.image_ref)
+        if image_path is None:
+            print(f"[PPTX] Warning: Background image not found: {images_dir / slide_info.background.image_ref}")
             return
 
         try:
-            slide.shapes.add_picture(
-                str(image_path),
-                Inches(0),
-                Inches(0),
-                width=Inches(self.slide_width_inches),
-                height=Inches(self.slide_height_inches),
+            self._add_picture(
+                slide,
+                image_path,
+                slide_info.background.image_ref,
+                0,
+                0,
+                self._slide_emu[0],
+                self._slide_emu[1],
             )
         except Exception as e:
             print(f"[PPTX] Warning: Failed to add background {image_path}: {e}")
 
+    @staticmethod
+    def _list_images(images_dir: Path) -> FrozenSet[str]:
+        """Names of the regular files in images_dir (empty if it does not exist)."""
+        try:
+            with os.scandir(images_dir) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_file())
+        except FileNotFoundError:
+            return frozenset()
+
+    @staticmethod
+    def _resolve_images(
+        elements_list: List[SlideElements],
+        slides_info: List[Slide],
+        images_dir: Path,
+        image_names: FrozenSet[str],
+    ) -> Dict[str, Path]:
+        """
+        Check which referenced images exist, against a listing of images_dir.
+
+        Args:
+            elements_list: SlideElements whose ImageElements should be resolved
+            slides_info: Slides whose background images should be resolved
+            images_dir: Directory containing extracted images
+            image_names: File names in images_dir, from _list_images
+
+        Returns:
+            Mapping of image_ref to its path, for refs whose file exists
+        """
+        refs = [
+            element.image_ref
+            for elements in elements_list
+            for element in elements.elements
+            if type(element) is ImageElement
+        ]
+        refs.extend(
+            slide_info.background.image_ref
+            for slide_info in slides_info
+            if slide_info.background.mode == "image" and slide_info.background.image_ref
+        )
+
+        resolved = {}
+        for ref in refs:
+            path = images_dir / ref
+            # Refs into subdirectories are not in the listing; stat those
+            if ref in image_names or (path.name != ref and path.is_file()):
+                resolved[ref] = path
+        return resolved
+
+    def _shared_image_refs(
+        self, elements_list: List[SlideElements], slides_info: List[Slide]
+    ) -> FrozenSet[str]:
+        """Image refs used more than once in the deck, counting backgrounds."""
+        counts = Counter(
+            element.image_ref
+            for elements in elements_list
+            for element in elements.elements
+            if type(element) is ImageElement
+        )
+        if self.render_background:
+            counts.update(
+                slide_info.background.image_ref
+                for slide_info in slides_info
+                if slide_info.background.mode == "image" and slide_info.background.image_ref
+            )
+        return frozenset(ref for ref, count in counts.items() if count > 1)
+
+    def _add_picture(
+        self,
+        slide,
+        image_path: Path,
+        image_ref: str,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+    ):
+        """
+        Add a picture from image_path, with the file name as its alt text.
+
+        The image goes to add_picture as a stream (see _image_source), for which
+        python-pptx writes a generic "image.png" description; set the file name
+        as it would for a path.
+        """
+        picture = slide.shapes.add_picture(
+            self._image_source(image_path, image_ref), left, top, width=width, height=height
+        )
+        picture._element._nvXxPr.cNvPr.set("descr", image_path.name)
+        return picture
+
+    def _image_source(self, image_path: Path, image_ref: str) -> io.BytesIO:
+        """
+        Picture stream for add_picture.
+
+        Images used more than once in the deck are read from disk once and
+        served from memory; anything else is read fresh and not kept. Always a
+        stream (never a path), so the picture markup does not depend on
+        whether the image was cached.
+        """
+        if image_ref not in self._shared_refs:
+            return io.BytesIO(image_path.read_bytes())
+        data = self._image_cache.get(image_path)
+        if data is None:
+            data = image_path.read_bytes()
+            self._image_cache[image_path] = data
+        return io.BytesIO(data)
+
     def _render_shape(
-        self, element: ShapeElement, slide, slide_info: Slide
+        self,
+        element: ShapeElement,
+        slide,
+        slide_info: Slide,
+        emu: List[int],
     ) -> None:
-        """Render a shape element."""
-        # Convert bbox from pixels to inches
-        left, top, width, height = self._bbox_to_inches(
-            element.bbox.to_list(),
-            slide_info.width_px,
-            slide_info.height_px,
-        )
+        """Render a shape element at emu = (left, top, width, height)."""
+        left, top, width, height = emu
 
         # Map shape type
-        shape_type_map = {
-            "rectangle": MSO_SHAPE.RECTANGLE,
-            "circle": MSO_SHAPE.OVAL,
-            "line": MSO_SHAPE.ROUNDED_RECTANGLE,  # Placeholder
-            "arrow": MSO_SHAPE.RIGHT_ARROW,
-        }
-
-        shape_type = shape_type_map.get(element.shape_type, MSO_SHAPE.RECTANGLE)
+        shape_type = _SHAPE_TYPE_MAP.get(element.shape_type, MSO_SHAPE.RECTANGLE)
 
         # Add shape
         shape = slide.shapes.add_shape(
             shape_type,
-            Inches(left),
-            Inches(top),
-            Inches(width),
-            Inches(height),
+            left,
+            top,
+            width,
+            height,
         )
 
         # Apply fill color
         if element.fill_color:
-            color = self._parse_hex_color(element.fill_color)
-            if color:
+            rgb = _parse_hex_color(element.fill_color)
+            if rgb:
                 shape.fill.solid()
-                shape.fill.fore_color.rgb = color
+                shape.fill.fore_color.rgb = RGBColor(*rgb)
 
         # Apply border
         if element.border_color:
-            color = self._parse_hex_color(element.border_color)
-            if color:
-                shape.line.color.rgb = color
-                shape.line.width = Pt(element.border_width)
-
-    def _bbox_to_inches(
-        self, bbox: List[float], slide_width_px: float, slide_height_px: float
-    ) -> Tuple[float, float, float, float]:
+            rgb = _parse_hex_color(element.border_color)
+            if rgb:
+                shape.line.color.rgb = RGBColor(*rgb)
+                shape.line.width = _pt(element.border_width)
+
+    def _compute_scale(self, slide_info: Slide) -> Tuple[float, float]:
         """
-        Convert bounding box from pixels to inches.
+        Pixel-to-EMU scale factors for a slide.
 
         Args:
-            bbox: [x0, y0, x1, y1] in pixels
-            slide_width_px: Slide width in pixels
-            slide_height_px: Slide height in pixels
+            slide_info: Source slide (bbox coordinates are in its pixel space)
 
         Returns:
-            (left, top, width, height) in inches
+            (kx, ky) EMU per pixel horizontally and vertically
         """
-        x0, y0, x1, y1 = bbox
-
-        # Convert to relative coordinates (0-1)
-        x0_rel = x0 / slide_width_px
-        y0_rel = y0 / slide_height_px
-        x1_rel = x1 / slide_width_px
-        y1_rel = y1 / slide_height_px
-
-        # Convert to inches
-        left = x0_rel * self.slide_width_inches
-        top = y0_rel * self.slide_height_inches
-        width = (x1_rel - x0_rel) * self.slide_width_inches
-        height = (y1_rel - y0_rel) * self.slide_height_inches
-
-        return left, top, width, height
-
-    @staticmethod
-    def _parse_hex_color(hex_color: str) -> Optional[RGBColor]:
-        """Parse hex color string to RGBColor."""
-        try:
-            hex_color = hex_color.lstrip("#")
-            if len(hex_color) == 6:
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                return RGBColor(r, g, b)
-        except ValueError:
-            pass
-        return None
+        kx = self.slide_width_inches * _EMU_PER_INCH / slide_info.width_px
+        ky = self.slide_height_inches * _EMU_PER_INCH / slide_info.height_px
+        return kx, ky
+
+
+def _render_slide_part(
+    config: Tuple[float, float, int, bool],
+    elements: SlideElements,
+    slide_info: Slide,
+    images_dir: Path,
+    image_names: FrozenSet[str],
+    crop_paths: Dict[str, Optional[Path]],
+) -> bytes:
+    """Render one slide into a standalone PPTX in a worker process."""
+    slide_width_inches, slide_height_inches, dpi, render_background = config
+    renderer = PPTXRenderer(
+        slide_width_inches=slide_width_inches,
+        slide_height_inches=slide_height_inches,
+        dpi=dpi,
+        render_background=render_background,
+    )
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = renderer._slide_emu
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+    renderer._image_names = image_names
+    renderer._image_paths = renderer._resolve_images(
+        [elements], [slide_info], images_dir, image_names
+    )
+    renderer._crop_paths = crop_paths
+    renderer._render_slide(elements, slide, slide_info, images_dir)
+
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+def _append_slide_part(prs, slide_layout, slide_bytes: bytes) -> None:
+    """Copy the single slide of a worker-built PPTX onto a new slide of prs."""
+    src_slide = Presentation(io.BytesIO(slide_bytes)).slides[0]
+    dest_slide = prs.slides.add_slide(slide_layout)
+    dest_tree = dest_slide.shapes._spTree
+
+    skip = (qn("p:nvGrpSpPr"), qn("p:grpSpPr"), qn("p:extLst"))
+    for shape_el in src_slide.shapes._spTree.iterchildren():
+        if shape_el.tag in skip:
+            continue
+        new_el = copy.deepcopy(shape_el)
+        # Pictures reference their image part by rId; re-home the image in prs
+        for blip in new_el.iter(qn("a:blip")):
+            r_id = blip.get(qn("r:embed"))
+            if not r_id:
+                continue
+            image_part = src_slide.part.rels[r_id].target_part
+            _, new_r_id = dest_slide.part.get_or_add_image_part(io.BytesIO(image_part.blob))
+            blip.set(qn("r:embed"), new_r_id)
+        dest_tree.append(new_el)
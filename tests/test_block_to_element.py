@@ -0,0 +1,217 @@
+"""
+Tests for block-to-element conversion with a stubbed Gemini client.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from sliderefactor.models import BBox, Block, ImageElement, Slide, TextBoxElement
+from sliderefactor.prompt.block_to_element import BlockToElementConverter
+
+
+class FakeModels:
+    """Stands in for client.models; answers each prompt via a responder."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.prompts = []
+
+    def generate_content(self, model, contents, config):
+        self.prompts.append(contents)
+        return SimpleNamespace(text=self.responder(contents))
+
+
+def _converter(monkeypatch, responder):
+    """Converter whose client is a fake recording every prompt."""
+    fake = SimpleNamespace(models=FakeModels(responder))
+    monkeypatch.setattr(
+        BlockToElementConverter, "_shared_client", staticmethod(lambda api_key: fake)
+    )
+    return BlockToElementConverter(api_key="test"), fake.models
+
+
+def _prompt_indices(prompt):
+    """slide_index values of a batch prompt; empty for a single-slide prompt."""
+    return [int(i) for i in re.findall(r'"slide_index":(\d+)', prompt)]
+
+
+def _slide(page_index, image=False):
+    """A non-trivial slide: a title and a body block, plus an optional image."""
+    blocks = [
+        Block(id=f"p{page_index}/title", type="text", bbox=BBox(coords=[10, 10, 190, 30]),
+              text=f"Title {page_index}"),
+        Block(id=f"p{page_index}/body", type="text", bbox=BBox(coords=[10, 40, 190, 60]),
+              text=f"Body {page_index}"),
+    ]
+    if image:
+        blocks.append(
+            Block(id=f"p{page_index}/img", type="image", bbox=BBox(coords=[10, 80, 90, 140]),
+                  image_ref=f"img_{page_index}.png")
+        )
+    return Slide(page_index=page_index, width_px=200, height_px=150, blocks=blocks)
+
+
+def _plan(page_index):
+    """The element plan the fake LLM returns for a slide."""
+    return [
+        {
+            "kind": "textbox",
+            "bbox": [10, 10, 190, 60],
+            "role": "title",
+            "structure": {"type": "paragraphs", "items": [{"text": f"plan {page_index}"}]},
+            "provenance": {"block_ids": [f"p{page_index}/title", f"p{page_index}/body"]},
+        }
+    ]
+
+
+def _batch_response(indices):
+    # Answer in reverse order so routing must rely on slide_index, not position
+    return json.dumps(
+        {"slides": [{"slide_index": i, "elements": _plan(i)} for i in reversed(indices)]}
+    )
+
+
+def _texts(slide_elements):
+    return [
+        element.structure.items[0]
+        for element in slide_elements.elements
+        if isinstance(element, TextBoxElement)
+    ]
+
+
+def _engines(slide_elements):
+    return {engine for element in slide_elements.elements for engine in element.provenance.engines}
+
+
+def test_convert_batch_routes_by_slide_index(monkeypatch):
+    """Test that batch plans reach their slides and results keep input order."""
+    converter, models = _converter(
+        monkeypatch, lambda prompt: _batch_response(_prompt_indices(prompt))
+    )
+    trivial = Slide(page_index=11, width_px=200, height_px=150)
+    slides = [_slide(13), trivial, _slide(10), _slide(12)]
+
+    results = converter.convert_batch(slides, k=3)
+
+    assert [_prompt_indices(prompt) for prompt in models.prompts] == [[13, 10, 12]]
+    assert [r.slide_index for r in results] == [13, 11, 10, 12]
+    assert _texts(results[0]) == ["plan 13"]
+    assert results[1].elements == []
+    assert _texts(results[2]) == ["plan 10"]
+    assert _texts(results[3]) == ["plan 12"]
+
+
+def test_convert_batch_missing_slide_falls_back(monkeypatch):
+    """Test that a slide left out of the batch response gets direct conversion."""
+    converter, _ = _converter(
+        monkeypatch, lambda prompt: _batch_response([i for i in _prompt_indices(prompt) if i != 1])
+    )
+
+    results = converter.convert_batch([_slide(0), _slide(1), _slide(2)], k=3)
+
+    assert _texts(results[0]) == ["plan 0"]
+    assert _texts(results[1]) == ["Title 1", "Body 1"]
+    assert _engines(results[1]) == {"fallback"}
+    assert _texts(results[2]) == ["plan 2"]
+
+
+def test_convert_batch_unparsable_response_falls_back(monkeypatch):
+    """Test that every slide of a batch falls back when its JSON cannot be parsed."""
+    converter, _ = _converter(monkeypatch, lambda prompt: '{"slides": [')
+
+    results = converter.convert_batch([_slide(0), _slide(1)], k=2)
+
+    assert [r.slide_index for r in results] == [0, 1]
+    for page_index, slide_elements in enumerate(results):
+        assert _texts(slide_elements) == [f"Title {page_index}", f"Body {page_index}"]
+        assert _engines(slide_elements) == {"fallback"}
+
+
+def test_convert_batch_single_slide_chunk_uses_convert(monkeypatch):
+    """Test that a chunk holding one slide is sent with the single-slide prompt."""
+
+    def responder(prompt):
+        indices = _prompt_indices(prompt)
+        if indices:
+            return _batch_response(indices)
+        return json.dumps({"elements": _plan(2)})
+
+    converter, models = _converter(monkeypatch, responder)
+
+    results = converter.convert_batch([_slide(0), _slide(1), _slide(2)], k=2)
+
+    assert [_prompt_indices(prompt) for prompt in models.prompts] == [[0, 1], []]
+    assert "Title 2" in models.prompts[1]
+    assert [_texts(r) for r in results] == [["plan 0"], ["plan 1"], ["plan 2"]]
+
+
+@pytest.mark.parametrize(
+    "blocks",
+    [
+        [],
+        [Block(id="p0/title", type="text", bbox=BBox(coords=[10, 10, 190, 30]), text="Only")],
+        [
+            Block(id="p0/a", type="image", bbox=BBox(coords=[10, 10, 90, 70]), image_ref="a.png"),
+            Block(id="p0/b", type="image", bbox=BBox(coords=[110, 10, 190, 70]), image_ref="b.png"),
+        ],
+    ],
+)
+def test_convert_skips_llm_for_trivial_slide(monkeypatch, blocks):
+    """Test that trivial slides are converted directly without an LLM request."""
+    converter, models = _converter(monkeypatch, lambda prompt: pytest.fail("LLM called"))
+    slide = Slide(page_index=0, width_px=200, height_px=150, blocks=blocks)
+
+    result = converter.convert(slide)
+
+    assert models.prompts == []
+    assert len(result.elements) == len(blocks)
+    assert _engines(result) <= {"fallback"}
+
+
+def test_convert_recovers_skipped_images(monkeypatch):
+    """Test that image blocks missing from the plan are appended as images."""
+    converter, _ = _converter(monkeypatch, lambda prompt: json.dumps({"elements": _plan(0)}))
+
+    result = converter.convert(_slide(0, image=True))
+
+    images = [e for e in result.elements if isinstance(e, ImageElement)]
+    assert _texts(result) == ["plan 0"]
+    assert len(images) == 1
+    assert images[0].image_ref == "img_0.png"
+    assert images[0].provenance.block_ids == ["p0/img"]
+    assert images[0].provenance.engines == ["recovery"]
+
+
+def test_convert_batch_keeps_planned_images(monkeypatch):
+    """Test that recovery in a batch adds only the images the plan left out."""
+
+    def responder(prompt):
+        plan_0 = _plan(0) + [
+            {
+                "kind": "image",
+                "bbox": [10, 80, 90, 140],
+                "image_ref": "img_0.png",
+                "provenance": {"block_ids": ["p0/img"]},
+            }
+        ]
+        return json.dumps(
+            {
+                "slides": [
+                    {"slide_index": 0, "elements": plan_0},
+                    {"slide_index": 1, "elements": _plan(1)},
+                ]
+            }
+        )
+
+    converter, _ = _converter(monkeypatch, responder)
+
+    results = converter.convert_batch([_slide(0, image=True), _slide(1, image=True)], k=2)
+
+    images = [[e for e in r.elements if isinstance(e, ImageElement)] for r in results]
+    assert [len(i) for i in images] == [1, 1]
+    assert images[0][0].provenance.engines == []
+    assert images[1][0].image_ref == "img_1.png"
+    assert images[1][0].provenance.engines == ["recovery"]
@@ -0,0 +1,25 @@
+"""
+Tests for font name normalization.
+"""
+
+from sliderefactor.fonts import DEFAULT_FONT, normalize_font_name
+
+
+def test_normalize_font_name():
+    """Test PDF font name normalization."""
+    assert normalize_font_name(None) == DEFAULT_FONT
+    assert normalize_font_name("") == DEFAULT_FONT
+    assert normalize_font_name("ArialMT") == "Arial"
+    assert normalize_font_name("BCDEEE+Calibri") == "Calibri"
+    assert normalize_font_name("TimesNewRomanPS-BoldMT") == "Times New Roman"
+    assert normalize_font_name("Helvetica Neue Light") == "Arial"
+    assert normalize_font_name("ArialNarrow-Bold") == "Arial Narrow"
+    assert normalize_font_name("CambriaMath") == "Cambria Math"
+    assert normalize_font_name("SomeRobotoVariant") == "Roboto"
+    assert normalize_font_name("UnknownFont") == "UnknownFont"
+
+
+def test_normalize_font_name_idempotent():
+    """Test that normalized names map to themselves."""
+    for name in ("Arial", "Times New Roman", "Arial Narrow", "Segoe UI", "Open Sans", "UnknownFont"):
+        assert normalize_font_name(name) == name
@@ -10,6 +10,8 @@ from sliderefactor.models import (
     SlideGraph,
     SlideGraphMeta,
     Provenance,
+    FontHints,
+    TextRun,
 )
 
 
@@ -110,3 +112,11 @@ def test_slidegraph_serialization():
     assert slide_graph2.meta.source == "test"
     assert len(slide_graph2.slides) == 1
     assert slide_graph2.slides[0].page_index == 0
+
+
+def test_font_names_normalized():
+    """Test that font names are normalized on model construction."""
+    assert FontHints(name="BCDEEE+ArialMT").name == "Arial"
+    assert FontHints().name is None
+    assert TextRun(text="x", font_name="TimesNewRomanPSMT").font_name == "Times New Roman"
+    assert TextRun(text="x").font_name is None
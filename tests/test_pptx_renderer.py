@@ -0,0 +1,230 @@
+"""
+Tests for the PPTX renderer.
+"""
+
+import pytest
+from lxml import etree
+from PIL import Image
+from pptx import Presentation
+from pptx.oxml.ns import qn
+from pptx.util import Pt
+
+from sliderefactor.models import (
+    BackgroundConfig,
+    BBox,
+    FontHints,
+    ImageElement,
+    ShapeElement,
+    Slide,
+    SlideElements,
+    StyleHints,
+    TextBoxElement,
+    TextStructure,
+)
+from sliderefactor.renderers import pptx_renderer
+from sliderefactor.renderers.pptx_renderer import (
+    PPTXRenderer,
+    _paragraphs_xml,
+    _parse_hex_color,
+    strip_html_tags,
+)
+
+
+def test_strip_html_tags():
+    """Test HTML tag stripping and line breaks."""
+    assert strip_html_tags("") == ""
+    assert strip_html_tags("  plain text ") == "plain text"
+    assert strip_html_tags("one<br>two<br/>three") == "one\ntwo\nthree"
+    assert strip_html_tags("<p>first</p><div>second</div>") == "first\nsecond"
+    assert strip_html_tags("<h2>Title</h2>body") == "Title\nbody"
+    assert strip_html_tags("<b>bold</b> <i>text</i>") == "bold text"
+
+
+def test_strip_html_entities():
+    """Test HTML entity conversion."""
+    assert strip_html_tags("a &amp; b") == "a & b"
+    assert strip_html_tags("&lt;tag&gt;") == "<tag>"
+    assert strip_html_tags("&quot;quoted&quot; &#39;single&#39;") == "\"quoted\" 'single'"
+    assert strip_html_tags("a&nbsp;b") == "a b"
+    # Entities are decoded once, not re-decoded after '&amp;' expands
+    assert strip_html_tags("&amp;lt;") == "&lt;"
+
+
+def test_parse_hex_color():
+    """Test hex color parsing."""
+    assert _parse_hex_color("#FF8000") == (255, 128, 0)
+    assert _parse_hex_color("00ff7f") == (0, 255, 127)
+    assert _parse_hex_color("#FFF") is None
+    assert _parse_hex_color("GGGGGG") is None
+    assert _parse_hex_color("-12345") is None
+
+
+def _paragraph_markup(items, style_hints, font_hints):
+    """Render paragraphs into a fresh textbox; canonical XML of each <a:p>."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(0, 0, 914400, 914400).text_frame
+    PPTXRenderer()._add_paragraphs(text_frame, items, style_hints, Pt(18), font_hints)
+    return [
+        etree.tostring(p, method="c14n", exclusive=True)
+        for p in text_frame._txBody.p_lst
+    ]
+
+
+def test_paragraphs_xml_matches_object_model(monkeypatch):
+    """Test that the XML fast path emits the markup python-pptx would."""
+    items = [
+        "one\ntwo",
+        "line\vbreak",
+        "",
+        "a &lt; b &amp; c &gt; d",  # decoded to "a < b & c > d" before escaping
+        "tab\there",
+        "two\n\nbreaks",
+    ]
+    cases = [
+        (StyleHints(), None),
+        (
+            StyleHints(align="center", weight="bold"),
+            FontHints(name="Arial", size=20, italic=True, color="#FF8000"),
+        ),
+        (StyleHints(align="right"), FontHints(color="336699")),
+    ]
+    for style_hints, font_hints in cases:
+        fast = _paragraph_markup(items, style_hints, font_hints)
+        with monkeypatch.context() as m:
+            m.setattr(pptx_renderer, "_paragraphs_xml", lambda *args: None)
+            slow = _paragraph_markup(items, style_hints, font_hints)
+        assert len(fast) == len(items)
+        assert fast == slow
+
+
+def test_paragraphs_xml_control_char_fallback():
+    """Test that text needing python-pptx's escaping takes the object-model path."""
+    assert _paragraphs_xml(["bell\x07"], "l", "<a:rPr/>") is None
+    assert _paragraphs_xml(["ok", "esc\x1b"], "l", "<a:rPr/>") is None
+    markup = _paragraph_markup(["bell\x07"], StyleHints(), None)
+    assert len(markup) == 1 and b"bell" in markup[0]
+
+
+def _write_deck_images(images_dir, n_slides):
+    """Write page, background and logo images for a small test deck."""
+    images_dir.mkdir()
+    Image.new("RGB", (40, 30), (200, 0, 0)).save(images_dir / "logo.png")
+    for i in range(n_slides):
+        Image.new("RGB", (200, 150), (0, 40 * i, 255)).save(images_dir / f"page_{i}.png")
+        Image.new("RGB", (200, 150), (255, 255, 40 * i)).save(images_dir / f"bg_{i}.png")
+
+
+def _deck(n_slides):
+    """Slides and elements: text, shapes, a shared image and page-crop fallbacks."""
+    slides_info = [
+        Slide(
+            page_index=i,
+            width_px=200,
+            height_px=150,
+            background=BackgroundConfig(mode="image", image_ref=f"bg_{i}.png"),
+        )
+        for i in range(n_slides)
+    ]
+    elements_list = [
+        SlideElements(
+            slide_index=i,
+            elements=[
+                TextBoxElement(
+                    bbox=BBox(coords=[10, 10, 190, 40]),
+                    role="title",
+                    structure=TextStructure(type="paragraphs", items=[f"Slide {i}"]),
+                ),
+                ImageElement(bbox=BBox(coords=[10, 50, 50, 80]), image_ref="logo.png"),
+                # Missing on disk: cropped from the page image
+                ImageElement(bbox=BBox(coords=[60, 50, 120, 100]), image_ref=f"chart_{i}"),
+                ImageElement(bbox=BBox(coords=[130, 50, 190, 100]), image_ref="shared_missing"),
+                ShapeElement(
+                    bbox=BBox(coords=[10, 110, 190, 140]),
+                    shape_type="rectangle",
+                    fill_color="#336699",
+                ),
+            ],
+        )
+        for i in range(n_slides)
+    ]
+    return elements_list, slides_info
+
+
+def _media_parts(prs):
+    return sorted(
+        part.partname for part in prs.part.package.iter_parts()
+        if part.partname.startswith("/ppt/media/")
+    )
+
+
+def test_parallel_render_matches_serial(tmp_path):
+    """Test that worker-built slides stitch into the same deck as a serial render."""
+    decks = {}
+    for workers in (1, 2):
+        images_dir = tmp_path / f"images_{workers}"
+        _write_deck_images(images_dir, 3)
+        elements_list, slides_info = _deck(3)
+        output_path = tmp_path / f"deck_{workers}.pptx"
+        PPTXRenderer(workers=workers).render(elements_list, slides_info, output_path, images_dir)
+        decks[workers] = Presentation(str(output_path))
+
+    serial, parallel = decks[1], decks[2]
+    assert len(parallel.slides) == len(serial.slides) == 3
+    assert _media_parts(parallel) == _media_parts(serial)
+
+    for serial_slide, parallel_slide in zip(serial.slides, parallel.slides):
+        assert etree.tostring(parallel_slide._element) == etree.tostring(serial_slide._element)
+
+        # Every picture in the stitched slide points at the same image as serially
+        blips = list(parallel_slide._element.iter(qn("a:blip")))
+        assert len(blips) == 4  # background, logo and two page crops
+        for blip in blips:
+            r_id = blip.get(qn("r:embed"))
+            parallel_blob = parallel_slide.part.related_part(r_id).blob
+            assert parallel_blob == serial_slide.part.related_part(r_id).blob
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_picture_alt_text_is_file_name(tmp_path, workers):
+    """Test that pictures keep their image file name as alt text."""
+    images_dir = tmp_path / "images"
+    _write_deck_images(images_dir, 2)
+    elements_list, slides_info = _deck(2)
+    output_path = tmp_path / "deck.pptx"
+    PPTXRenderer(workers=workers).render(elements_list, slides_info, output_path, images_dir)
+
+    for i, slide in enumerate(Presentation(str(output_path)).slides):
+        descrs = [
+            pic.get("descr") for pic in slide._element.iter(qn("p:cNvPr"))
+            if pic.getparent().tag == qn("p:nvPicPr")
+        ]
+        # Background, shared logo and the two page crops
+        assert descrs == [f"bg_{i}.png", "logo.png", f"chart_{i}.png", "shared_missing.png"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_background_in_subdirectory(tmp_path, workers):
+    """Test that background refs into subdirectories resolve like element images."""
+    images_dir = tmp_path / "images"
+    (images_dir / "backgrounds").mkdir(parents=True)
+    Image.new("RGB", (200, 150), (0, 128, 0)).save(images_dir / "backgrounds" / "bg.png")
+    slides_info = [
+        Slide(
+            page_index=i,
+            width_px=200,
+            height_px=150,
+            background=BackgroundConfig(mode="image", image_ref="backgrounds/bg.png"),
+        )
+        for i in range(2)
+    ]
+    elements_list = [SlideElements(slide_index=i) for i in range(2)]
+    output_path = tmp_path / "deck.pptx"
+    PPTXRenderer(workers=workers).render(elements_list, slides_info, output_path, images_dir)
+
+    for slide in Presentation(str(output_path)).slides:
+        blips = list(slide._element.iter(qn("a:blip")))
+        assert len(blips) == 1
+        assert slide.part.related_part(blips[0].get(qn("r:embed"))).blob == (
+            images_dir / "backgrounds" / "bg.png"
+        ).read_bytes()